@@ -18,6 +18,11 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
 
 @dataclass(frozen=True)
 class Segment:
@@ -62,9 +67,22 @@ CANDIDATE_REQUIRED_KEYS = frozenset(
 )
 
 
+def dumps_jsonl_line(d: Dict[str, Any]) -> bytes:
+    """Serialize one record as a UTF-8 JSONL line, trailing newline included."""
+    if orjson is not None:
+        return orjson.dumps(d, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(d, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def write_jsonl(path: Path, records: List[Any]) -> None:
     """Write dataclass instances or dicts to JSONL."""
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with path.open("wb") as fb:
+            for r in records:
+                d = asdict(r) if hasattr(r, "__dataclass_fields__") else r
+                fb.write(orjson.dumps(d, option=orjson.OPT_APPEND_NEWLINE))
+        return
     with path.open("w", encoding="utf-8") as f:
         for r in records:
             d = asdict(r) if hasattr(r, "__dataclass_fields__") else r
@@ -76,10 +94,11 @@ def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
     if not path.exists():
         return out
-    with path.open("r", encoding="utf-8") as f:
+    loads = orjson.loads if orjson is not None else json.loads
+    with path.open("rb") as f:
         for line in f:
             s = line.strip()
             if not s:
                 continue
-            out.append(json.loads(s))
+            out.append(loads(s))
     return out
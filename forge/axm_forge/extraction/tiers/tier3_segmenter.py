@@ -19,7 +19,7 @@ from typing import List
 
 import pysbd
 
-from axm_forge.extraction.schemas import Segment
+from axm_forge.extraction.schemas import Segment, dumps_jsonl_line
 
 
 def _build_byte_offset_table(text: str) -> List[int]:
@@ -96,15 +96,15 @@ def run_segmentation(source_path: Path, out_path: Path) -> int:
     segments = segment_source(source_bytes)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
+    with out_path.open("wb", buffering=1 << 20) as f:
         for s in segments:
-            f.write(json.dumps({
+            f.write(dumps_jsonl_line({
                 "index": s.index,
                 "text": s.text,
                 "byte_start": s.byte_start,
                 "byte_end": s.byte_end,
                 "page": s.page,
-            }, ensure_ascii=False) + "\n")
+            }))
 
     return len(segments)
 
@@ -30,9 +30,14 @@ import json
 import re
 from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
-from axm_forge.extraction.schemas import read_jsonl
+from axm_forge.extraction.schemas import dumps_jsonl_line, read_jsonl
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 
 # ---------------------------------------------------------------------------
@@ -190,6 +195,25 @@ class EntityResolver:
 # Main Binder
 # ---------------------------------------------------------------------------
 
+# candidates.jsonl write buffer: candidates are flushed in 1 MiB writes
+# rather than every 8 KiB.
+_OUT_BUFFER = 1 << 20
+
+
+def _iter_raw_claims(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream records from raw_claims.jsonl, skipping blank and malformed lines."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with path.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
 def run_stage2(
     source_path: Path,
     sentences_path: Path,
@@ -214,28 +238,18 @@ def run_stage2(
 
     # Pass 1: register all entity mentions to build frequency stats.
     # This ensures case voting has full information before we emit anything.
-    raw_lines: List[Dict[str, Any]] = []
-    with raw_claims_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                raw = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            raw_lines.append(raw)
-
-            meta = raw.get("meta", {})
-            if isinstance(meta, dict) and meta.get("type") == "progress":
-                continue
-
-            subj = (raw.get("subject") or "").strip()
-            obj = (raw.get("object") or "").strip()
-            if subj:
-                resolver.register(subj)
-            if obj and _classify_object_type(obj) == "entity":
-                resolver.register(obj)
+    # Both passes stream raw_claims.jsonl so claims are never all held in memory.
+    for raw in _iter_raw_claims(raw_claims_path):
+        meta = raw.get("meta", {})
+        if isinstance(meta, dict) and meta.get("type") == "progress":
+            continue
+
+        subj = (raw.get("subject") or "").strip()
+        obj = (raw.get("object") or "").strip()
+        if subj:
+            resolver.register(subj)
+        if obj and _classify_object_type(obj) == "entity":
+            resolver.register(obj)
 
     # Pass 2: bind claims to byte spans and emit
     seen_claims: Set[Tuple[str, int, int]] = set()
@@ -249,8 +263,8 @@ def run_stage2(
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with out_path.open("w", encoding="utf-8") as f_out:
-        for raw in raw_lines:
+    with out_path.open("wb", buffering=_OUT_BUFFER) as f_out:
+        for raw in _iter_raw_claims(raw_claims_path):
             total_raw += 1
 
             # Skip progress markers
@@ -348,7 +362,7 @@ def run_stage2(
                         "raw_object": raw_obj,
                     },
                 }
-                f_out.write(json.dumps(candidate, ensure_ascii=False) + "\n")
+                f_out.write(dumps_jsonl_line(candidate))
                 emitted += 1
 
     return {
@@ -18,10 +18,12 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import os
 import subprocess
 import sys
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 REQUIRED_MODULES = [
@@ -66,10 +68,13 @@ def build_pythonpath(root: Path) -> str:
 
 
 def import_checks() -> tuple[bool, list[str]]:
+    # Presence check only: find_spec resolves the loader without executing
+    # module code, so heavy native deps (duckdb, pyarrow) are not loaded here.
     failures: list[str] = []
     for m in REQUIRED_MODULES:
         try:
-            __import__(m)
+            if importlib.util.find_spec(m) is None:
+                failures.append(f"{m}: module not found")
         except Exception as e:
             failures.append(f"{m}: {e}")
     return (len(failures) == 0), failures
@@ -97,13 +102,16 @@ def run_gold_verify(python_exe: str, env: dict[str, str], root: Path) -> tuple[i
 
 
 def env_report(env: dict[str, str]) -> dict:
+    # Read versions from installed distribution metadata rather than
+    # importing each package (pyarrow alone maps tens of MB of libraries).
     versions = {}
     for m in ["blake3", "duckdb", "pyarrow", "click", "cryptography"]:
         try:
-            mod = __import__(m)
-            versions[m] = getattr(mod, "__version__", "unknown")
-        except Exception:
+            versions[m] = version(m)
+        except PackageNotFoundError:
             versions[m] = "missing"
+        except Exception:
+            versions[m] = "unknown"
 
     return {
         "python_executable": sys.executable,
@@ -15,13 +15,24 @@ Can also orchestrate the full pipeline when AXM_DOCTOR_TIER3=1.
 """
 from __future__ import annotations
 
+import codecs
 import json
+import mmap
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from axm_forge.extraction.schemas import read_jsonl
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None  # type: ignore
 
 
 @dataclass(frozen=True)
@@ -34,9 +45,11 @@ class Tier3CheckResult:
     ambiguous_spans: int = 0
     ambiguity_rate: Optional[float] = None
     drop_rate: Optional[float] = None
+    ambiguity_method: str = "per_needle"
+    truncated: bool = False
 
 
-def _count_occurrences_capped(hay: bytes, needle: bytes, cap: int = 2) -> int:
+def _count_occurrences_capped(hay: Union[bytes, mmap.mmap], needle: bytes, cap: int = 2) -> int:
     """Count occurrences of needle in hay, capped at `cap`.  Early exit."""
     if not needle:
         return 0
@@ -51,75 +64,211 @@ def _count_occurrences_capped(hay: bytes, needle: bytes, cap: int = 2) -> int:
     return count
 
 
+# Below this many distinct needles per-needle find() beats building an automaton.
+_AC_MIN_NEEDLES = 8
+# Bytes of new source fed to the automaton per step; bounds the heap copy of
+# a memory-mapped source.
+_AC_CHUNK = 1 << 22
+
+
+def _char_start(hay: Union[bytes, mmap.mmap], pos: int) -> int:
+    """Move pos back to the first byte of the UTF-8 sequence containing it."""
+    while 0 < pos < len(hay) and 0x80 <= hay[pos] < 0xC0:
+        pos -= 1
+    return pos
+
+
+def _count_needles(hay: Union[bytes, mmap.mmap], needles: List[bytes]) -> Tuple[List[int], str]:
+    """Count occurrences (capped at 2) of each needle; return (counts, method).
+
+    With pyahocorasick installed and enough needles, all needles are matched
+    in a single pass over hay instead of one find() scan per needle.  The
+    automaton reports overlapping matches, the same as the find() loop.
+    hay is fed in _AC_CHUNK windows that overlap by the longest needle minus
+    one byte; a match is counted only in the window where it ends past the
+    overlap, so matches spanning a boundary are neither missed nor doubled.
+    """
+    if ahocorasick is None or len(needles) < _AC_MIN_NEEDLES:
+        return [_count_occurrences_capped(hay, n) for n in needles], "per_needle"
+    automaton = ahocorasick.Automaton()
+    # hay is valid UTF-8, so str matches correspond one-to-one to byte matches.
+    as_str = bool(ahocorasick.unicode)
+    for idx, needle in enumerate(needles):
+        automaton.add_word(needle.decode("utf-8") if as_str else needle, idx)
+    automaton.make_automaton()
+    overlap = max(len(n) for n in needles) - 1
+    counts = [0] * len(needles)
+    size = len(hay)
+    done = 0
+    while done < size:
+        start = _char_start(hay, max(0, done - overlap))
+        end = min(size, done + _AC_CHUNK)
+        while end < size and 0x80 <= hay[end] < 0xC0:
+            end += 1
+        head = hay[start:done]
+        tail = hay[done:end]
+        if as_str:
+            head_str = str(head, "utf-8")
+            head_len = len(head_str)
+            text: Union[str, bytes] = head_str + str(tail, "utf-8")
+        else:
+            head_len = len(head)
+            text = head + tail
+        for last, idx in automaton.iter(text):
+            if last >= head_len and counts[idx] < 2:
+                counts[idx] += 1
+        done = end
+    return counts, "aho_corasick"
+
+
+def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream records from a JSONL file, skipping blank lines."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with path.open("rb") as f:
+        for raw_line in f:
+            raw_line = raw_line.strip()
+            if raw_line:
+                yield loads(raw_line)
+
+
+_UTF8_CHUNK = 1 << 20
+
+# Evidence at least this many bytes long is assumed unique and skips the
+# ambiguity scan, but only in sources smaller than _AMBIG_SKIP_MAX_SOURCE,
+# where accidental repetition is implausible.  0 disables the heuristic
+# (every needle is scanned).
+AMBIG_LEN_SKIP = int(os.environ.get("AXM_DOCTOR_AMBIG_LEN_SKIP", "256"))
+_AMBIG_SKIP_MAX_SOURCE = 1 << 20
+
+
+def _check_utf8(buf: Union[bytes, mmap.mmap]) -> Optional[str]:
+    """Validate UTF-8 in bounded chunks; return an error message or None.
+
+    Pure-ASCII chunks are accepted via bytes.isascii(), which scans a word at
+    a time in C without building a str; only chunks with multi-byte sequences
+    go through the decoder.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    size = len(buf)
+    for off in range(0, size, _UTF8_CHUNK):
+        chunk = buf[off:off + _UTF8_CHUNK]
+        # Bytes of a split sequence carried over from the previous chunk.
+        pending = len(decoder.getstate()[0])
+        if not pending and chunk.isascii():
+            continue
+        try:
+            decoder.decode(chunk, final=off + _UTF8_CHUNK >= size)
+        except UnicodeDecodeError as exc:
+            return f"{exc.reason} at byte {off - pending + exc.start}"
+    return None
+
+
 def validate_candidates_against_source(
     source_path: Path,
     candidates_path: Path,
+    *,
+    max_errors: int = 0,
 ) -> Tier3CheckResult:
     """
     Byte-exact validation of candidates.jsonl against source.txt.
 
     Every candidate must satisfy:
         source_bytes[byte_start:byte_end] == evidence.encode("utf-8")
-    """
-    errors: List[str] = []
 
+    source.txt is memory-mapped read-only rather than copied into memory.
+
+    Validation stops after `max_errors` errors (0 = no limit); the result is
+    then marked truncated and its counts cover only the rows examined.
+    """
     if not source_path.exists():
         return Tier3CheckResult(ok=False, errors=[f"missing source: {source_path}"])
     if not candidates_path.exists():
         return Tier3CheckResult(ok=False, errors=[f"missing candidates: {candidates_path}"])
 
-    source_bytes = source_path.read_bytes()
-    try:
-        source_bytes.decode("utf-8")
-    except UnicodeDecodeError as exc:
-        return Tier3CheckResult(ok=False, errors=[f"source.txt invalid utf-8: {exc}"])
-
-    candidates = read_jsonl(candidates_path)
-    validated = 0
-    ambiguous_count = 0
-    ambiguity_cache: Dict[bytes, int] = {}
-
-    for i, c in enumerate(candidates):
-        bs = c.get("byte_start")
-        be = c.get("byte_end")
-        ev = c.get("evidence")
-        subj = c.get("subject")
-        pred = c.get("predicate")
-        obj = c.get("object")
-
-        if not all(isinstance(x, str) for x in [ev, subj, pred, obj]):
-            errors.append(f"row {i}: subject/predicate/object/evidence must be strings")
-            continue
-        if not isinstance(bs, int) or not isinstance(be, int):
-            errors.append(f"row {i}: byte_start/byte_end must be int")
-            continue
-        if len(ev) == 0:
-            errors.append(f"row {i}: evidence string is empty")
-            continue
-        if bs >= be:
-            errors.append(f"row {i}: zero-length or inverted span {bs}:{be}")
-            continue
-        if bs < 0 or be > len(source_bytes):
-            errors.append(f"row {i}: span {bs}:{be} out of bounds (source len {len(source_bytes)})")
-            continue
+    with source_path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            # mmap rejects empty files.
+            return _validate_source(b"", candidates_path, max_errors)
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return _validate_source(mm, candidates_path, max_errors)
+        finally:
+            mm.close()
 
-        slice_bytes = source_bytes[bs:be]
-        ev_bytes = ev.encode("utf-8")
 
-        if slice_bytes != ev_bytes:
-            errors.append(f"row {i}: span bytes do not match evidence bytes")
-            continue
+def _validate_source(
+    source: Union[bytes, mmap.mmap],
+    candidates_path: Path,
+    max_errors: int,
+) -> Tier3CheckResult:
+    errors: List[str] = []
 
-        cached = ambiguity_cache.get(ev_bytes)
-        if cached is None:
-            cached = _count_occurrences_capped(source_bytes, ev_bytes)
-            ambiguity_cache[ev_bytes] = cached
-        if cached >= 2:
-            ambiguous_count += 1
+    utf8_error = _check_utf8(source)
+    if utf8_error is not None:
+        return Tier3CheckResult(ok=False, errors=[f"source.txt invalid utf-8: {utf8_error}"])
 
-        validated += 1
+    source_len = len(source)
+    skip_len = AMBIG_LEN_SKIP if source_len < _AMBIG_SKIP_MAX_SOURCE else 0
+    total = 0
+    validated = 0
+    # Validated rows per distinct evidence; counted against source after the loop.
+    needle_rows: Dict[bytes, int] = {}
+    length_skipped = 0
+    truncated = False
+
+    # One view over the source for the whole loop; released before the caller
+    # closes the mapping.
+    with memoryview(source) as view:
+        for i, c in enumerate(_iter_jsonl(candidates_path)):
+            if max_errors and len(errors) >= max_errors:
+                truncated = True
+                break
+            total += 1
+            bs = c.get("byte_start")
+            be = c.get("byte_end")
+            ev = c.get("evidence")
+            subj = c.get("subject")
+            pred = c.get("predicate")
+            obj = c.get("object")
+
+            if not all(isinstance(x, str) for x in [ev, subj, pred, obj]):
+                errors.append(f"row {i}: subject/predicate/object/evidence must be strings")
+                continue
+            if not isinstance(bs, int) or not isinstance(be, int):
+                errors.append(f"row {i}: byte_start/byte_end must be int")
+                continue
+            if len(ev) == 0:
+                errors.append(f"row {i}: evidence string is empty")
+                continue
+            if bs >= be:
+                errors.append(f"row {i}: zero-length or inverted span {bs}:{be}")
+                continue
+            if bs < 0 or be > source_len:
+                errors.append(f"row {i}: span {bs}:{be} out of bounds (source len {source_len})")
+                continue
+
+            ev_bytes = ev.encode("utf-8")
+
+            if view[bs:be] != ev_bytes:
+                errors.append(f"row {i}: span bytes do not match evidence bytes")
+                continue
+
+            if skip_len and len(ev_bytes) >= skip_len:
+                # Long spans practically never recur; treat as unique.
+                length_skipped += 1
+                validated += 1
+                continue
+
+            needle_rows[ev_bytes] = needle_rows.get(ev_bytes, 0) + 1
+            validated += 1
+
+    needles = list(needle_rows)
+    counts, ambiguity_method = _count_needles(source, needles)
+    ambiguous_count = sum(needle_rows[n] for n, k in zip(needles, counts) if k >= 2)
+    if length_skipped and not needles:
+        # Only the length heuristic decided ambiguity for this run.
+        ambiguity_method = "length_skip"
 
-    total = len(candidates)
     dropped = total - validated
 
     ambiguity_rate: Optional[float] = round(ambiguous_count / validated, 4) if validated > 0 else None
@@ -134,6 +283,8 @@ def validate_candidates_against_source(
         ambiguous_spans=ambiguous_count,
         ambiguity_rate=ambiguity_rate,
         drop_rate=drop_rate,
+        ambiguity_method=ambiguity_method,
+        truncated=truncated,
     )
 
 
@@ -189,7 +340,7 @@ def run_tier3_doctor(
         report["tier3_extract"] = {"skipped": True, "reason": "validation_only"}
 
     if cand_path.exists():
-        vr = validate_candidates_against_source(source_path, cand_path)
+        vr = validate_candidates_against_source(source_path, cand_path, max_errors=20)
         report["tier3_validate"] = {
             "ok": vr.ok,
             "emitted": vr.emitted,
@@ -198,7 +349,9 @@ def run_tier3_doctor(
             "drop_rate": vr.drop_rate,
             "ambiguous_spans": vr.ambiguous_spans,
             "ambiguity_rate": vr.ambiguity_rate,
-            "errors": vr.errors[:20],
+            "ambiguity_method": vr.ambiguity_method,
+            "errors": vr.errors,
+            "truncated": vr.truncated,
         }
         return vr.ok, report
 
@@ -218,7 +371,11 @@ def main() -> None:
     args = p.parse_args()
 
     ok, report = run_tier3_doctor(Path(args.out_dir), validation_only=args.validation_only)
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.flush()
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
     raise SystemExit(0 if ok else 1)
 
 
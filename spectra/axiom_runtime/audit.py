@@ -1,15 +1,114 @@
 import json
+import os
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+
+def _dumps_line(payload: Dict[str, Any]) -> bytes:
+    # The audit log's byte format: json.dumps defaults (", "/": " separators,
+    # ASCII escapes) with sorted keys. External readers and diffs rely on it,
+    # so orjson, which cannot emit these separators, is not used here.
+    return (json.dumps(payload, sort_keys=True) + "\n").encode("ascii")
+
+
+class _AuditSink:
+    """The log's file descriptor and pending lines, shared with the writer thread.
+
+    Kept apart from AuditLogger so the thread never references the logger
+    itself, and an unreferenced logger can be collected and finalized.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.fd: Optional[int] = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        # pending_lock guards the queue and closed flag and is only held for
+        # an append or swap; io_lock serializes drains so order is kept.
+        self.pending: List[bytes] = []
+        self.pending_lock = threading.Lock()
+        self.io_lock = threading.Lock()
+        self.closed = False
+        self.wake = threading.Event()
+
+    def drain(self) -> None:
+        with self.io_lock:
+            with self.pending_lock:
+                batch, self.pending = self.pending, []
+            if not batch or self.fd is None:
+                return
+            data = b"".join(batch)
+            with memoryview(data) as view:
+                off = 0
+                while off < len(view):
+                    off += os.write(self.fd, view[off:])
+
+
+def _audit_writer_loop(sink: _AuditSink, flush_interval: float) -> None:
+    while not sink.closed:
+        sink.wake.wait(flush_interval)
+        sink.wake.clear()
+        sink.drain()
+
+
+def _stop_audit_writer(sink: _AuditSink, thread: threading.Thread) -> None:
+    """Stop the writer, append whatever is still pending, and close the file."""
+    with sink.pending_lock:
+        if sink.closed:
+            return
+        sink.closed = True
+    sink.wake.set()
+    if thread is not threading.current_thread():
+        thread.join()
+    sink.drain()
+    with sink.io_lock:
+        os.close(sink.fd)
+        sink.fd = None
+
 
 class AuditLogger:
-    def __init__(self, path: str) -> None:
+    """Append-only JSONL audit log.
+
+    write_event() timestamps and serializes the event in the caller, so a
+    bad event raises there, then queues the line. A daemon thread appends
+    queued lines with a single write once `buffer_events` are pending or
+    every `flush_interval` seconds, so the caller never waits on disk.
+    Pending lines are flushed on flush(), and the finalizer flushes them and
+    closes the file on close(), on collection, or at interpreter exit.
+    """
+
+    def __init__(self, path: str, *, buffer_events: int = 1024, flush_interval: float = 0.2) -> None:
         self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._buffer_events = buffer_events
+        self._sink = _AuditSink(self.path)
+        self._thread = threading.Thread(
+            target=_audit_writer_loop,
+            args=(self._sink, flush_interval),
+            name="spectra-audit",
+            daemon=True,
+        )
+        self._thread.start()
+        self._finalizer = weakref.finalize(self, _stop_audit_writer, self._sink, self._thread)
 
     def write_event(self, event: Dict[str, Any]) -> None:
-        payload = dict(event)
-        payload.setdefault("ts", time.time())
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, sort_keys=True) + "\n")
+        if "ts" in event:
+            payload = event
+        else:
+            payload = event.copy()
+            payload["ts"] = time.time()
+        line = _dumps_line(payload)
+        sink = self._sink
+        with sink.pending_lock:
+            if sink.closed:
+                raise ValueError("AuditLogger is closed")
+            sink.pending.append(line)
+            pending = len(sink.pending)
+        if pending >= self._buffer_events:
+            sink.wake.set()
+
+    def flush(self) -> None:
+        self._sink.drain()
+
+    def close(self) -> None:
+        self._finalizer()
@@ -19,15 +19,23 @@ class ChatEngine:
 
     def __init__(
         self,
+        index: Any = None,
         *,
         engine: Any = None,
         max_history: int = 20,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
     ) -> None:
+        self._index = index
+        self._provider = provider
+        self._model = model
+        self._base_url = base_url
         self._engine = engine
         self._max_history = max_history
         self._history: List[Dict[str, str]] = []
 
-    def ask(self, question: str) -> Dict[str, Any]:
+    def ask(self, question: str, top_k: int = 7) -> Dict[str, Any]:
         """Process a natural-language question and return results.
 
         Falls back to the engine's query_json if available,
@@ -1,4 +1,5 @@
 import base64
+import functools
 import hashlib
 import hmac
 from dataclasses import dataclass
@@ -23,13 +24,36 @@ def derive_root_secret(user_secret: bytes, salt: bytes, epoch: str) -> bytes:
     msg = salt + epoch.encode("utf-8")
     return hmac.new(user_secret, msg, hashlib.sha256).digest()
 
+class PartitionKDF:
+    """Derives partition keys from one root secret.
+
+    The HMAC key schedule (ipad/opad) is computed once; each derive()
+    copies the keyed state instead of rebuilding it.
+    """
+
+    def __init__(self, root_secret: bytes) -> None:
+        self._template = hmac.new(root_secret, None, hashlib.sha256)
+
+    def derive(self, color: str, topo_hash: bytes) -> bytes:
+        h = self._template.copy()
+        h.update(color.encode("utf-8"))
+        h.update(b"|")
+        h.update(topo_hash)
+        return h.digest()
+
 def derive_partition_key(root_secret: bytes, color: str, topo_hash: bytes) -> bytes:
     msg = color.encode("utf-8") + b"|" + topo_hash
     return hmac.new(root_secret, msg, hashlib.sha256).digest()
 
+@functools.lru_cache(maxsize=128)
+def _aesgcm(key32: bytes) -> "AESGCM":
+    return AESGCM(key32)
+
+def clear_cipher_cache() -> None:
+    """Drop cached AESGCM instances (and the key material they hold)."""
+    _aesgcm.cache_clear()
+
 def decrypt_bytes(key: bytes, blob: EncryptedBlob, *, aad: Optional[bytes] = None) -> bytes:
     if AESGCM is None:
         raise ImportError("cryptography is required for Clarion decrypt")
-    k = key[:32]
-    aesgcm = AESGCM(k)
-    return aesgcm.decrypt(blob.nonce, blob.ciphertext, aad)
+    return _aesgcm(bytes(key[:32])).decrypt(blob.nonce, blob.ciphertext, aad)
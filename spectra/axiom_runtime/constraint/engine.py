@@ -17,17 +17,29 @@ then namespace it as "constraint/{type}".
 """
 from __future__ import annotations
 
+import functools
 import json
 import re
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ..util import sha256_hex
 from .types import (
     ConstraintMatch, ConstraintType, Decision, DecisionStatus,
     EvaluateRequest, ProvenanceTrace, TYPE_PRECEDENCE, DENY_BY_DEFAULT,
 )
 
 
+# Precedence rank per constraint type value (lower wins).
+_PREC_INDEX: Dict[str, int] = {v: i for i, v in enumerate(TYPE_PRECEDENCE)}
+
+# Tags recognised in claim subject/object text, with their lowercase form.
+_TYPE_TAGS: Tuple[Tuple[str, str], ...] = tuple(
+    (t, t.lower()) for t in ("ROE", "FSCM", "ACM", "WCS", "FPCON", "EMCON", "JRFL")
+)
+
+
 def _to_ctype(tag: str) -> ConstraintType:
     try:
         return ConstraintType(tag.upper())
@@ -36,30 +48,36 @@ def _to_ctype(tag: str) -> ConstraintType:
 
 
 def _prec_index(ctype: ConstraintType) -> int:
-    try:
-        return TYPE_PRECEDENCE.index(ctype.value)
-    except ValueError:
-        return len(TYPE_PRECEDENCE) + 100
+    return _PREC_INDEX.get(ctype.value, len(TYPE_PRECEDENCE) + 100)
 
 
+_UTC = timezone.utc
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_iso(s: str) -> Optional[datetime]:
+    # Cached: validity bounds repeat across many rules, and datetimes are immutable.
     s = s.strip().rstrip("Z")
     try:
         d = datetime.fromisoformat(s)
-        return d.replace(tzinfo=timezone.utc) if d.tzinfo is None else d
+        return d.replace(tzinfo=_UTC) if d.tzinfo is None else d
     except Exception:
         return None
 
 
-def _within_validity(metadata: Dict[str, Any], context: Dict[str, Any]) -> bool:
-    now = datetime.now(timezone.utc)
+def _resolve_now(context: Dict[str, Any]) -> datetime:
+    """Evaluation time: the first parseable now/time/timestamp in context, else wall clock."""
     for k in ("now", "time", "timestamp"):
         v = context.get(k)
         if isinstance(v, str):
             d = _parse_iso(v)
             if d:
-                now = d
-                break
+                return d
+    return datetime.now(_UTC)
+
+
+def _within_validity(metadata: Dict[str, Any], now: datetime) -> bool:
+    """Check valid_from/valid_to bounds against a time from _resolve_now()."""
     vf = metadata.get("valid_from")
     vt = metadata.get("valid_to") or metadata.get("valid_until")
     if isinstance(vf, str):
@@ -73,6 +91,52 @@ def _within_validity(metadata: Dict[str, Any], context: Dict[str, Any]) -> bool:
     return True
 
 
+# Predicates that make a claim a candidate match in _find_matches.
+_MATCH_PREDICATES = frozenset(("PROHIBITS", "PERMITS", "REQUIRES", "APPLIES_TO"))
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """A matchable claim with its request-independent text work done up front."""
+    claim: Dict[str, Any]
+    subj: str              # lowercased subject
+    obj: str               # lowercased object
+    text: str              # subj + "\x00" + obj, one haystack for containment tests
+    ctype: ConstraintType
+
+
+@dataclass
+class _ClaimSet:
+    """Claims from one catalog state plus the indexes derived from them."""
+    claims: List[Dict[str, Any]] = field(default_factory=list)
+    rules: List[_Rule] = field(default_factory=list)
+    deleg: Dict[str, str] = field(default_factory=dict)     # delegatee -> delegator
+    revoked: Set[str] = field(default_factory=set)
+    revoke_notes: List[str] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, claims: List[Dict[str, Any]]) -> "_ClaimSet":
+        cs = cls(claims=claims)
+        for c in claims:
+            pred = c["predicate"]
+            if pred in _MATCH_PREDICATES:
+                subj = (c["subject"] or "").lower()
+                obj = (c["object"] or "").lower()
+                # Classify constraint type from claim predicate/subject text
+                ctype_tag = "GUIDANCE"
+                for tag, tag_l in _TYPE_TAGS:
+                    if tag_l in subj or tag_l in obj:
+                        ctype_tag = tag
+                        break
+                cs.rules.append(_Rule(c, subj, obj, f"{subj}\x00{obj}", _to_ctype(ctype_tag)))
+            elif pred == "DELEGATES_TO":
+                cs.deleg[c["subject"]] = c["object"]
+            elif pred == "REVOKES":
+                cs.revoked.add((c["object"] or "").upper())
+                cs.revoke_notes.append(f"delegation_revoked:{c['object']}")
+        return cs
+
+
 class ConstraintEngine:
     """
     Evaluates constraints from mounted Spectra shards.
@@ -83,22 +147,42 @@ class ConstraintEngine:
 
     def __init__(self, spectra_engine: Any) -> None:
         self._engine = spectra_engine
+        # (catalog fingerprint, claim set) from the last successful pull.
+        self._claims_cache: Optional[Tuple[str, _ClaimSet]] = None
 
     def _get_constraint_claims(self) -> List[Dict[str, Any]]:
         """Pull all claims + entity labels from constraint-namespaced shards."""
+        return self._get_claim_set().claims
+
+    def _get_claim_set(self) -> _ClaimSet:
+        """Return the cached claim set, re-querying only when mounts change.
+
+        The fingerprint covers every mount's shard_id and merkle_root, so any
+        mount/unmount (or a remount of changed content) forces a re-query.
+        """
         try:
             cat = self._engine.catalog_json()
         except Exception:
-            return []
+            self._claims_cache = None
+            return _ClaimSet()
+
+        fp = sha256_hex(json.dumps(cat.get("mounts", []), sort_keys=True))
+        if self._claims_cache is not None and self._claims_cache[0] == fp:
+            return self._claims_cache[1]
 
         claims: List[Dict[str, Any]] = []
+        complete = True
         for mount in cat.get("mounts", []):
             shard_id = mount.get("shard_id", "")
             tables = mount.get("tables", [])
-            claims_view = next(
-                (t for t in tables if t.startswith("claims__")), None)
-            entities_view = next(
-                (t for t in tables if t.startswith("entities__")), None)
+            claims_view = entities_view = None
+            for t in tables:
+                if claims_view is None and t.startswith("claims__"):
+                    claims_view = t
+                elif entities_view is None and t.startswith("entities__"):
+                    entities_view = t
+                if claims_view and entities_view:
+                    break
             if not claims_view or not entities_view:
                 continue
 
@@ -129,43 +213,42 @@ class ConstraintEngine:
                         "shard_id": shard_id,
                     })
             except Exception:
+                complete = False
                 continue
 
-        return claims
+        claim_set = _ClaimSet.build(claims)
+        # Don't pin a partial read; retry the failed shard next call.
+        self._claims_cache = (fp, claim_set) if complete else None
+        return claim_set
 
     def _find_matches(
         self,
         req: EvaluateRequest,
-        claims: List[Dict[str, Any]],
+        claim_set: _ClaimSet,
     ) -> List[ConstraintMatch]:
         """Find claims applicable to this request."""
-        matches: List[ConstraintMatch] = []
-        for c in claims:
-            pred = c["predicate"]
-            if pred not in ("PROHIBITS", "PERMITS", "REQUIRES", "APPLIES_TO"):
-                continue
-            subj = (c["subject"] or "").lower()
-            obj = (c["object"] or "").lower()
-            action_l = req.action.lower()
-            target_l = req.target.lower()
+        action_l = req.action.lower()
+        target_l = req.target.lower()
+        # The NUL separator keeps a needle from matching across subj/obj,
+        # unless the needle itself contains NUL; test the fields separately then.
+        joined_ok = "\x00" not in action_l and "\x00" not in target_l
 
+        matches: List[ConstraintMatch] = []
+        for r in claim_set.rules:
             # Match: subject or object mentions action or target
-            if not (action_l in subj or action_l in obj or
-                    target_l in subj or target_l in obj or
-                    subj in action_l or obj in target_l):
+            if joined_ok:
+                hit = action_l in r.text or target_l in r.text
+            else:
+                hit = (action_l in r.subj or action_l in r.obj or
+                       target_l in r.subj or target_l in r.obj)
+            if not (hit or r.subj in action_l or r.obj in target_l):
                 continue
 
-            # Classify constraint type from claim predicate/subject text
-            ctype_tag = "GUIDANCE"
-            for tag in ("ROE", "FSCM", "ACM", "WCS", "FPCON", "EMCON", "JRFL"):
-                if tag.lower() in subj or tag.lower() in obj:
-                    ctype_tag = tag
-                    break
-
+            c = r.claim
             matches.append(ConstraintMatch(
                 constraint_id=c["claim_id"],
-                constraint_type=_to_ctype(ctype_tag),
-                match_reason=f"predicate={pred} subject={c['subject'][:40]}",
+                constraint_type=r.ctype,
+                match_reason=f"predicate={c['predicate']} subject={c['subject'][:40]}",
                 weight=1.0,
             ))
         return matches
@@ -173,20 +256,12 @@ class ConstraintEngine:
     def _resolve_authority_chain(
         self,
         actor: str,
-        claims: List[Dict[str, Any]],
+        claim_set: _ClaimSet,
     ) -> Tuple[List[str], List[str], Set[str]]:
         """Walk DELEGATES_TO chain upward. Collect REVOKES."""
-        notes: List[str] = []
-        revoked: Set[str] = set()
-
-        # Build delegation map: delegatee -> delegator
-        deleg: Dict[str, str] = {}
-        for c in claims:
-            if c["predicate"] == "DELEGATES_TO":
-                deleg[c["subject"]] = c["object"]
-            elif c["predicate"] == "REVOKES":
-                revoked.add((c["object"] or "").upper())
-                notes.append(f"delegation_revoked:{c['object']}")
+        notes: List[str] = list(claim_set.revoke_notes)
+        revoked = claim_set.revoked
+        deleg = claim_set.deleg
 
         chain = [actor]
         seen: Set[str] = {actor}
@@ -204,7 +279,8 @@ class ConstraintEngine:
 
     def evaluate(self, req: EvaluateRequest) -> Decision:
         """Evaluate an action against all mounted constraint shards."""
-        claims = self._get_constraint_claims()
+        claim_set = self._get_claim_set()
+        claims = claim_set.claims
 
         if not claims:
             return Decision(
@@ -214,18 +290,19 @@ class ConstraintEngine:
                 confidence=0.0,
             )
 
-        matches = self._find_matches(req, claims)
-        auth_chain, notes, revoked = self._resolve_authority_chain(req.actor, claims)
+        matches = self._find_matches(req, claim_set)
+        auth_chain, notes, revoked = self._resolve_authority_chain(req.actor, claim_set)
 
         # Select controlling constraint by doctrine precedence
         controlling: Optional[ConstraintMatch] = None
         if matches:
             # FSCM always controls unless explicit ROE override
-            fscm = [m for m in matches if m.constraint_type == ConstraintType.FSCM]
-            if fscm:
-                controlling = fscm[0]
+            for m in matches:
+                if m.constraint_type is ConstraintType.FSCM:
+                    controlling = m
+                    break
             else:
-                controlling = sorted(matches, key=lambda m: _prec_index(m.constraint_type))[0]
+                controlling = min(matches, key=lambda m: _prec_index(m.constraint_type))
 
         if not matches:
             status = DecisionStatus.DENY if DENY_BY_DEFAULT else DecisionStatus.PERMIT
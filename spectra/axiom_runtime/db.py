@@ -1,16 +1,21 @@
 import base64
+import hashlib
+import hmac
 import json
 import os
+import queue
 import sqlite3
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # Cryptography check for Posture 2
 try:
     from cryptography.fernet import Fernet
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
     _HAS_CRYPTO = True
 except ImportError:
@@ -67,14 +72,26 @@ CREATE TABLE IF NOT EXISTS mounts (
 );
 
 CREATE TABLE IF NOT EXISTS system_events (
-    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id INTEGER PRIMARY KEY,
     ts REAL NOT NULL,
     event_type TEXT NOT NULL,
     actor_id TEXT,
     details JSON
 );
+
+CREATE INDEX IF NOT EXISTS idx_mounts_automount ON mounts(auto_mount) WHERE auto_mount = 1;
+CREATE INDEX IF NOT EXISTS idx_events_ts ON system_events(ts);
 """
 
+# Derived vault ciphers keyed by (sha256(system key), salt), so repeated
+# SystemCatalog construction in one process runs PBKDF2 only once. The raw
+# system key itself is never used as a cache key.
+_VAULT_CACHE: Dict[Tuple[bytes, bytes], Tuple[Any, Any]] = {}
+
+# Leading byte of AES-GCM vault tokens: version || nonce(12) || ciphertext+tag.
+# Legacy Fernet tokens are base64 text starting with "g", so they never collide.
+_VAULT_AESGCM_V1 = b"\x01"
+
 
 class SystemVault:
     def __init__(self, db_conn: sqlite3.Connection):
@@ -95,13 +112,18 @@ class SystemVault:
         salt_b64 = self._get_or_create_salt(db_conn)
         salt = base64.b64decode(salt_b64)
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=600000,
-        )
-        self._fernet = Fernet(base64.urlsafe_b64encode(kdf.derive(key_raw.encode())))
+        cache_key = (hashlib.sha256(key_raw.encode()).digest(), salt)
+        ciphers = _VAULT_CACHE.get(cache_key)
+        if ciphers is None:
+            # hashlib calls straight into OpenSSL's PBKDF2; same output as
+            # cryptography's PBKDF2HMAC with identical parameters.
+            derived = hashlib.pbkdf2_hmac("sha256", key_raw.encode(), salt, 600000, dklen=32)
+            # Separate AES-GCM key so it never shares material with Fernet,
+            # which is kept only to read secrets stored before the switch.
+            aead_key = hmac.new(derived, b"spectra-vault-aesgcm-v1", hashlib.sha256).digest()
+            ciphers = (AESGCM(aead_key), Fernet(base64.urlsafe_b64encode(derived)))
+            _VAULT_CACHE[cache_key] = ciphers
+        self._aead, self._fernet = ciphers
 
     def _get_or_create_salt(self, conn: sqlite3.Connection) -> str:
         cur = conn.execute("SELECT value FROM meta WHERE key='vault_salt'")
@@ -119,32 +141,218 @@ class SystemVault:
         return salt_b64
 
     def encrypt(self, secret: str) -> bytes:
-        return self._fernet.encrypt(secret.encode("utf-8"))
+        nonce = os.urandom(12)
+        return _VAULT_AESGCM_V1 + nonce + self._aead.encrypt(nonce, secret.encode("utf-8"), None)
 
     def decrypt(self, token: bytes) -> str:
+        if token[:1] == _VAULT_AESGCM_V1:
+            return self._aead.decrypt(token[1:13], token[13:], None).decode("utf-8")
         return self._fernet.decrypt(token).decode("utf-8")
 
 
+# Queued by flush() so the writer commits what precedes it without waiting
+# out the batch window.
+_FLUSH_EVENTS = ("flush",)
+
+
+def _stop_event_writer(events: "queue.Queue[Any]", thread: threading.Thread) -> None:
+    """Queue the stop sentinel and wait for the writer to commit what precedes it."""
+    events.put(None)
+    if thread is not threading.current_thread():
+        thread.join()
+
+
 class SystemCatalog:
+    # Idle read-only connections kept for reuse.
+    _READER_POOL_SIZE = 4
+    # System events are committed in batches of up to this many rows, or
+    # after this many seconds from the first pending event.
+    _EVENT_BATCH_MAX = 256
+    _EVENT_BATCH_WINDOW = 0.2
+
+    # Hot write statements. Kept as constants so every call hits the same
+    # entry in the long-lived connection's prepared-statement cache.
+    _SQL_UPSERT_MOUNT = """
+        INSERT INTO mounts (
+            mount_id, doc_id, shard_path, enc_secret, expected_topology_hash, mount_config,
+            created_at, updated_at, status, last_ok_ts, last_attempt_ts, retry_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'active', ?, ?, 0)
+        ON CONFLICT(mount_id) DO UPDATE SET
+            status='active',
+            enc_secret=excluded.enc_secret,
+            mount_config=excluded.mount_config,
+            expected_topology_hash=excluded.expected_topology_hash,
+            last_ok_ts=excluded.last_ok_ts,
+            last_attempt_ts=excluded.last_attempt_ts,
+            retry_count=0,
+            updated_at=excluded.updated_at
+    """
+    _SQL_SET_MOUNT_ERROR = """
+        UPDATE mounts SET
+            status='error',
+            last_error=?,
+            last_attempt_ts=?,
+            retry_count = retry_count + 1,
+            updated_at=?
+        WHERE mount_id=?
+    """
+    _SQL_SET_MOUNT_STOPPED = "UPDATE mounts SET status='stopped', updated_at=? WHERE mount_id=?"
+    _SQL_INSERT_EVENT = """
+        INSERT INTO system_events (ts, event_type, actor_id, details)
+        VALUES (?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._init_db()
-        with self.get_connection() as conn:
+
+        # One long-lived writer (SQLite allows a single writer at a time
+        # anyway) and a small pool of query_only readers.
+        self._write_conn = self.get_connection()
+        self._write_lock = threading.Lock()
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+
+        with self._writer() as conn:
             self.vault = SystemVault(conn)
 
+        # log_system_event is fire-and-forget: rows go through a background
+        # writer that commits them in batches (one fsync per batch). The
+        # writer thread holds the queue and connection but not the catalog,
+        # and the finalizer drains it on close(), on collection, or at exit.
+        self._event_queue: "queue.Queue[Optional[Tuple[float, str, Optional[str], str]]]" = queue.Queue()
+        self._event_lock = threading.Lock()
+        self._closed = False
+        self._event_thread = threading.Thread(
+            target=self._event_writer_loop,
+            args=(self._event_queue, self._write_conn, self._write_lock),
+            name="spectra-catalog-events",
+            daemon=True,
+        )
+        self._event_thread.start()
+        self._stop_events = weakref.finalize(self, _stop_event_writer, self._event_queue, self._event_thread)
+
     def get_connection(self) -> sqlite3.Connection:
-        # Concurrency robustness
-        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        # Concurrency robustness. check_same_thread is off because pooled
+        # connections move between threads; access is serialized by the pool.
+        conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA busy_timeout = 5000")
+        # Per-connection tuning. NORMAL is durable across app crashes in WAL
+        # mode (only a power loss can drop the last commits).
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -64000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
         return conn
 
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """Serialized access to the writer; commits on success, rolls back on error."""
+        with self._write_lock:
+            try:
+                yield self._write_conn
+                self._write_conn.commit()
+            except BaseException:
+                self._write_conn.rollback()
+                raise
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a query_only connection from the pool (opened on demand)."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self.get_connection()
+            conn.execute("PRAGMA query_only = ON")
+        try:
+            yield conn
+        finally:
+            if self._readers.qsize() < self._READER_POOL_SIZE:
+                self._readers.put(conn)
+            else:
+                conn.close()
+
+    @classmethod
+    def _event_writer_loop(
+        cls,
+        events: "queue.Queue[Optional[Tuple[float, str, Optional[str], str]]]",
+        conn: sqlite3.Connection,
+        lock: threading.Lock,
+    ) -> None:
+        while True:
+            item = events.get()
+            if item is None:
+                events.task_done()
+                return
+            if item is _FLUSH_EVENTS:
+                events.task_done()
+                continue
+            batch = [item]
+            stop = False
+            markers = 0
+            deadline = time.monotonic() + cls._EVENT_BATCH_WINDOW
+            while len(batch) < cls._EVENT_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    markers += 1
+                    break
+                if nxt is _FLUSH_EVENTS:
+                    markers += 1
+                    break
+                batch.append(nxt)
+            try:
+                with lock:
+                    try:
+                        conn.executemany(cls._SQL_INSERT_EVENT, batch)
+                        conn.commit()
+                    except BaseException:
+                        conn.rollback()
+                        raise
+            except Exception as e:
+                print(f"[Catalog] Failed to write {len(batch)} system events: {e}", file=sys.stderr)
+            finally:
+                for _ in range(len(batch) + markers):
+                    events.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Block until every queued system event has been committed."""
+        with self._event_lock:
+            if self._closed:
+                return
+            self._event_queue.put(_FLUSH_EVENTS)
+        self._event_queue.join()
+
+    def close(self) -> None:
+        """Flush pending events, then close the writer and all pooled readers."""
+        with self._event_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop_events()
+        with self._write_lock:
+            self._write_conn.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
     def _init_db(self) -> None:
         # Apply timeouts here too for safe startup
         with sqlite3.connect(self.db_path, timeout=5.0) as conn:
             conn.execute("PRAGMA busy_timeout = 5000")
             conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
             conn.executescript(SCHEMA_V1)
 
             cur = conn.execute("SELECT value FROM meta WHERE key='schema_version'")
@@ -172,55 +380,30 @@ class SystemCatalog:
         ts = time.time()
         config_json = json.dumps(mount_config) if mount_config else None
 
-        with self.get_connection() as conn:
+        with self._writer() as conn:
             # FIX: 10 placeholders, 10 values (status and retry_count are literals)
             conn.execute(
-                """
-                INSERT INTO mounts (
-                    mount_id, doc_id, shard_path, enc_secret, expected_topology_hash, mount_config,
-                    created_at, updated_at, status, last_ok_ts, last_attempt_ts, retry_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'active', ?, ?, 0)
-                ON CONFLICT(mount_id) DO UPDATE SET
-                    status='active',
-                    enc_secret=excluded.enc_secret,
-                    mount_config=excluded.mount_config,
-                    expected_topology_hash=excluded.expected_topology_hash,
-                    last_ok_ts=excluded.last_ok_ts,
-                    last_attempt_ts=excluded.last_attempt_ts,
-                    retry_count=0,
-                    updated_at=excluded.updated_at
-                """,
+                self._SQL_UPSERT_MOUNT,
                 (mount_id, doc_id, path, enc, topo_hash, config_json, ts, ts, ts, ts),
             )
-            conn.commit()
 
     def set_mount_error(self, mount_id: str, error: str) -> None:
         ts = time.time()
-        with self.get_connection() as conn:
+        with self._writer() as conn:
             conn.execute(
-                """
-                UPDATE mounts SET
-                    status='error',
-                    last_error=?,
-                    last_attempt_ts=?,
-                    retry_count = retry_count + 1,
-                    updated_at=?
-                WHERE mount_id=?
-                """,
+                self._SQL_SET_MOUNT_ERROR,
                 (str(error), ts, ts, mount_id),
             )
-            conn.commit()
 
     def set_mount_stopped(self, mount_id: str) -> None:
-        with self.get_connection() as conn:
+        with self._writer() as conn:
             conn.execute(
-                "UPDATE mounts SET status='stopped', updated_at=? WHERE mount_id=?",
+                self._SQL_SET_MOUNT_STOPPED,
                 (time.time(), mount_id),
             )
-            conn.commit()
 
     def get_active_mounts(self) -> List[Dict[str, Any]]:
-        with self.get_connection() as conn:
+        with self._reader() as conn:
             rows = conn.execute("SELECT * FROM mounts WHERE auto_mount=1").fetchall()
 
         results: List[Dict[str, Any]] = []
@@ -250,19 +433,17 @@ class SystemCatalog:
         actor_id: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ) -> None:
-        with self.get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO system_events (ts, event_type, actor_id, details)
-                VALUES (?, ?, ?, ?)
-                """,
-                (time.time(), event_type, actor_id, json.dumps(details or {})),
-            )
-            conn.commit()
+        # Timestamp at call time; the row itself is committed asynchronously.
+        # Call flush() when the event must be durable before continuing.
+        row = (time.time(), event_type, actor_id, json.dumps(details or {}))
+        with self._event_lock:
+            if self._closed:
+                raise ValueError("SystemCatalog is closed")
+            self._event_queue.put(row)
 
     def check_health(self) -> Tuple[bool, Optional[str]]:
         try:
-            with self.get_connection() as conn:
+            with self._reader() as conn:
                 conn.execute("SELECT 1").fetchone()
             return True, None
         except Exception as e:
@@ -26,9 +26,26 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_line(obj: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+_TAIL_BLOCK = 64 * 1024
 
 
 class DecisionLogger:
@@ -51,9 +68,10 @@ class DecisionLogger:
     ) -> str:
         """Append an interaction. Returns the interaction ID."""
         ts = time.time()
-        interaction_id = "int_" + hashlib.sha256(
-            f"{ts}:{query}".encode()
-        ).hexdigest()[:16]
+        h = hashlib.blake2b(digest_size=8)
+        h.update(f"{ts}:".encode())
+        h.update(query.encode("utf-8"))
+        interaction_id = "int_" + h.hexdigest()
 
         record = {
             "interaction_id": interaction_id,
@@ -65,8 +83,8 @@ class DecisionLogger:
             "metadata": metadata or {},
         }
 
-        with self.log_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        with self.log_path.open("ab") as f:
+            f.write(_dumps_line(record))
 
         return interaction_id
 
@@ -74,17 +92,59 @@ class DecisionLogger:
         """Load all recorded interactions."""
         if not self.log_path.exists():
             return []
-        out = []
-        for line in self.log_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if line:
-                out.append(json.loads(line))
-        return out
+        raw = self.log_path.read_bytes()
+        return [_loads(line) for line in raw.split(b"\n") if line.strip()]
+
+    def iter_tail(self, max_records: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the last `max_records` interactions in log order (all when None).
+
+        Reads backwards from EOF in 64 KiB blocks, so memory is bounded by the
+        records returned rather than by the size of the log.
+        """
+        if not self.log_path.exists():
+            return
+        if not max_records:
+            with self.log_path.open("rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield _loads(line)
+            return
+
+        lines: List[bytes] = []
+        with self.log_path.open("rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            head = b""
+            while pos > 0 and len(lines) < max_records:
+                step = min(_TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                parts = (f.read(step) + head).split(b"\n")
+                # parts[0] may be the tail of a line that starts in an earlier block.
+                head = parts[0]
+                for part in reversed(parts[1:]):
+                    if part.strip():
+                        lines.append(part)
+                        if len(lines) == max_records:
+                            break
+            if pos == 0 and len(lines) < max_records and head.strip():
+                lines.append(head)
+
+        for line in reversed(lines):
+            yield _loads(line)
 
     def count(self) -> int:
         if not self.log_path.exists():
             return 0
-        return sum(1 for line in self.log_path.read_text().splitlines() if line.strip())
+        # record() always terminates lines, so counting newlines is exact for
+        # logs this class wrote; a final unterminated line still counts.
+        n = 0
+        last = b"\n"
+        with self.log_path.open("rb") as f:
+            while chunk := f.read(1 << 20):
+                n += chunk.count(b"\n")
+                last = chunk[-1:]
+        return n if last == b"\n" else n + 1
 
 
 class DecisionForgeAdapter:
@@ -119,15 +179,13 @@ class DecisionForgeAdapter:
         out_path = Path(out_path)
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        interactions = self.logger.load()
-        if max_records:
-            interactions = interactions[-max_records:]
-
+        total = 0
         written = 0
         skipped = 0
 
-        with out_path.open("w", encoding="utf-8") as f:
-            for rec in interactions:
+        with out_path.open("wb") as f:
+            for rec in self.logger.iter_tail(max_records):
+                total += 1
                 citations = rec.get("citations") or []
                 if len(citations) < min_citations:
                     skipped += 1
@@ -140,7 +198,7 @@ class DecisionForgeAdapter:
 
                 # Triple 1: query → was_answered_by → answer_summary
                 answer_summary = answer[:200].replace("\n", " ")
-                f.write(json.dumps({
+                f.write(_dumps_line({
                     "subject": f"query:{int_id}",
                     "predicate": "was_answered_by",
                     "object": answer_summary,
@@ -153,36 +211,38 @@ class DecisionForgeAdapter:
                         "interaction_id": int_id,
                         "ts": ts,
                     },
-                }) + "\n")
+                }))
                 written += 1
 
                 # Triple 2: one claim per citation (links query to source claims)
+                # Only object, evidence and source_shard vary per citation;
+                # the row is serialized immediately, so reuse it in place.
+                locator = {"kind": "decision", "interaction_id": int_id, "source_shard": ""}
+                row = {
+                    "subject": f"query:{int_id}",
+                    "predicate": "cites_claim",
+                    "object": "",
+                    "object_type": "entity",
+                    "tier": 0,
+                    "confidence": 1.0,
+                    "evidence": "",
+                    "locator": locator,
+                }
                 for cite in citations[:10]:
                     claim_id = cite.get("claim_id") or cite.get("id") or ""
-                    shard_id = cite.get("shard_id") or ""
+                    if not claim_id:
+                        continue
                     subj = cite.get("subject") or cite.get("subject_label") or ""
                     pred = cite.get("predicate") or "cited_by"
                     obj = cite.get("object") or cite.get("object_label") or ""
-                    if not claim_id:
-                        continue
-                    f.write(json.dumps({
-                        "subject": f"query:{int_id}",
-                        "predicate": "cites_claim",
-                        "object": claim_id,
-                        "object_type": "entity",
-                        "tier": 0,
-                        "confidence": 1.0,
-                        "evidence": f"{subj} → {pred} → {obj}",
-                        "locator": {
-                            "kind": "decision",
-                            "interaction_id": int_id,
-                            "source_shard": shard_id,
-                        },
-                    }) + "\n")
+                    row["object"] = claim_id
+                    row["evidence"] = f"{subj} → {pred} → {obj}"
+                    locator["source_shard"] = cite.get("shard_id") or ""
+                    f.write(_dumps_line(row))
                     written += 1
 
         return {
-            "total_interactions": len(interactions),
+            "total_interactions": total,
             "exported": written,
             "skipped_uncited": skipped,
             "output": str(out_path),
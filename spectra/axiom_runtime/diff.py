@@ -12,13 +12,36 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .util import quote_ident
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 # ---------------------------------------------------------------------------
 # Live shard diff — uses Spectra engine DuckDB views
 # ---------------------------------------------------------------------------
 
+_DIFF_LIMIT = 200
+
+
+def _ranked_ids(engine: Any, id_sql: str, id_col: str) -> Tuple[List[Any], int]:
+    """Run an ID-set query in DuckDB; return (first _DIFF_LIMIT sorted IDs, total count)."""
+    rows = engine.query_json(f"""
+        SELECT {id_col}, count(*) OVER ()
+        FROM ({id_sql}) ids
+        ORDER BY {id_col}
+        LIMIT {_DIFF_LIMIT}
+    """).get("rows", [])
+    return [r[0] for r in rows], (rows[0][1] if rows else 0)
+
+
 def diff_mounted_shards(
     engine: Any,
     base_mount_prefix: str,
@@ -55,42 +78,39 @@ def diff_mounted_shards(
         if not base_view or not delta_view:
             result[table_base_name] = {"error": "table not found in one or both mounts"}
             continue
+        base_view, delta_view = quote_ident(base_view), quote_ident(delta_view)
 
         try:
-            base_sql = f'SELECT {id_col} FROM "{base_view}"'
-            delta_sql = f'SELECT {id_col} FROM "{delta_view}"'
-            base_ids = {r[0] for r in engine.query_json(base_sql).get("rows", [])}
-            delta_ids = {r[0] for r in engine.query_json(delta_sql).get("rows", [])}
-
-            added = sorted(delta_ids - base_ids)
-            removed = sorted(base_ids - delta_ids)
+            added, added_count = _ranked_ids(engine, f"""
+                SELECT {id_col} FROM {delta_view}
+                EXCEPT
+                SELECT {id_col} FROM {base_view}
+            """, id_col)
+            removed, removed_count = _ranked_ids(engine, f"""
+                SELECT {id_col} FROM {base_view}
+                EXCEPT
+                SELECT {id_col} FROM {delta_view}
+            """, id_col)
 
             # Modified: same ID, different content hash
-            common = base_ids & delta_ids
-            modified = []
-            if common:
-                # Use a content hash to detect modifications
-                # Compare by joining on id and checking all columns
-                hash_sql = f"""
-                    SELECT b.{id_col}
-                    FROM "{base_view}" b
-                    JOIN "{delta_view}" d ON b.{id_col} = d.{id_col}
-                    WHERE b.{id_col} IN ({','.join(f"'{i}'" for i in list(common)[:500])})
-                      AND b != d
-                """
-                try:
-                    modified = sorted(
-                        r[0] for r in engine.query_json(hash_sql).get("rows", []))
-                except Exception:
-                    modified = []  # best-effort
+            try:
+                modified, modified_count = _ranked_ids(engine, f"""
+                    SELECT DISTINCT b.{id_col}
+                    FROM (SELECT {id_col}, hash(to_json(t)) AS h FROM {base_view} t) b
+                    JOIN (SELECT {id_col}, hash(to_json(t)) AS h FROM {delta_view} t) d
+                      ON b.{id_col} = d.{id_col}
+                    WHERE b.h <> d.h
+                """, id_col)
+            except Exception:
+                modified, modified_count = [], 0  # best-effort
 
             result[table_base_name] = {
-                "added": added[:200],
-                "removed": removed[:200],
-                "modified": modified[:200],
-                "added_count": len(added),
-                "removed_count": len(removed),
-                "modified_count": len(modified),
+                "added": added,
+                "removed": removed,
+                "modified": modified,
+                "added_count": added_count,
+                "removed_count": removed_count,
+                "modified_count": modified_count,
             }
         except Exception as e:
             result[table_base_name] = {"error": str(e)}
@@ -110,12 +130,12 @@ def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
     for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
         line = line.strip()
         if line:
-            rows.append(json.loads(line))
+            rows.append(_loads(line))
     return rows
 
 
 def _index_by_id(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-    return {it.get("id"): it for it in items if it.get("id")}
+    return {k: it for it in items if (k := it.get("id"))}
 
 
 def diff_packs(base: Path, delta: Path) -> Dict[str, Any]:
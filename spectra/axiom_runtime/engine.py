@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import json
 import os
 import shutil
@@ -9,25 +10,65 @@ import tempfile
 import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import duckdb
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import pyarrow  # type: ignore  # noqa: F401
+except Exception:
+    pyarrow = None  # type: ignore
+
 # In-process Genesis verification (preferred over shelling out)
 try:
     from axm_verify.logic import verify_shard as genesis_verify_shard  # type: ignore
 except Exception:
     genesis_verify_shard = None  # type: ignore
 
+_verifier_lock = threading.Lock()
+_verifier_retried = False
+
+
+def _in_process_verifier() -> Any:
+    """Return verify_shard, retrying the import once if it failed at module load.
+
+    Covers axm-verify being installed (or put on sys.path) after this module
+    was imported, so steady-state verification never pays for a subprocess.
+    """
+    global genesis_verify_shard, _verifier_retried
+    if genesis_verify_shard is None and not _verifier_retried:
+        with _verifier_lock:
+            if genesis_verify_shard is None and not _verifier_retried:
+                try:
+                    genesis_verify_shard = importlib.import_module("axm_verify.logic").verify_shard
+                except Exception:
+                    pass
+                _verifier_retried = True
+    return genesis_verify_shard
+
 from .audit import AuditLogger
 from .chat import ChatEngine
 from .db import SystemCatalog
 from .retrieval import Embedder, VectorIndex
 from .sqlgate import is_read_only_sql
 from .transport import TransportAdapter
-from .util import choose_temp_root, quote_ident, sanitize_identifier, sha256_hex
+from .util import RWLock, choose_temp_root, fingerprint_hex, quote_ident, sanitize_identifier
+
+# Monotonic clock for latencies and uptime; immune to wall-clock steps.
+_pc_ns = time.perf_counter_ns
+
+# Upper bound on mounts rehydrated concurrently by boot().
+_BOOT_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -52,6 +93,14 @@ class SpectraEngine:
 
     _NAMESPACE = uuid.UUID("3b1c7a74-0f9a-4c61-9cc8-8f2a3f5e0f5f")
 
+    # (relative path, table name, required) for the standard shard tables.
+    _SHARD_TABLES = (
+        ("graph/claims.parquet", "claims", True),
+        ("graph/entities.parquet", "entities", False),
+        ("graph/provenance.parquet", "provenance", False),
+        ("evidence/spans.parquet", "spans", False),
+    )
+
     def __init__(
         self,
         *,
@@ -60,12 +109,19 @@ class SpectraEngine:
         db_path: Optional[str] = None,
         temp_root: Optional[str] = None,
     ) -> None:
-        self._start_time = time.time()
-        self._lock = threading.RLock()
+        self._start_ns = _pc_ns()
+        # Queries, catalog reads and chat share the read side; anything that
+        # changes views or the vector index takes the write side.
+        self._lock = RWLock()
+        # ChatEngine keeps conversation state, so asks are serialized.
+        self._chat_lock = threading.Lock()
         self.con = duckdb.connect(":memory:")
         self._mount_dirs: Dict[str, Path] = {}
         self._mount_specs: Dict[str, MountSpec] = {}
-        self._claims: Dict[str, List[Dict[str, Any]]] = {}
+        # Sorted mount IDs for audit events; rebuilt on mount/unmount only.
+        self._mount_ids_sorted: Tuple[str, ...] = ()
+        # mount_id -> claims view; rows are only pulled when index() runs.
+        self._claim_views: Dict[str, str] = {}
 
         raw_audit = audit_path or os.environ.get("SPECTRA_AUDIT_PATH", "spectra_audit.jsonl")
         raw_cache = cache_path or os.environ.get("SPECTRA_CACHE_PATH", "spectra_cache.jsonl")
@@ -78,6 +134,8 @@ class SpectraEngine:
 
         self._audit_path = Path(raw_audit).expanduser().resolve(strict=False)
         self._cache_path = Path(raw_cache).expanduser().resolve(strict=False)
+        # Per-mount embedding matrices, next to the embedding cache file.
+        self._vector_dir = self._cache_path.with_name(self._cache_path.stem + ".vectors")
         self._db_path = Path(raw_db).expanduser().resolve(strict=False)
 
         self._audit = AuditLogger(str(self._audit_path))
@@ -129,8 +187,10 @@ class SpectraEngine:
                 )
 
         # Prefer in-process verification (faster, no subprocess overhead).
-        if genesis_verify_shard is not None:
-            result = genesis_verify_shard(shard_dir, trusted)
+        # SPECTRA_FORCE_CLI_VERIFY=1 pins the axm-verify CLI, e.g. to test it.
+        verify = None if os.environ.get("SPECTRA_FORCE_CLI_VERIFY") == "1" else _in_process_verifier()
+        if verify is not None:
+            result = verify(shard_dir, trusted)
             if result.get("status") != "PASS":
                 raise ValueError(f"Constitution check failed (in-process verify): {result}")
             return
@@ -166,6 +226,44 @@ class SpectraEngine:
             "Install axm-genesis (pip install axm-genesis) or vendor genesis into Spectra."
         )
 
+    @staticmethod
+    def _parquet_view_sql(view_name: str, pq_path: Path) -> str:
+        # DuckDB cannot bind parameters inside CREATE VIEW, so the path is
+        # inlined as an escaped string literal; this is the only place.
+        p = pq_path.as_posix().replace("'", "''")
+        return f"CREATE OR REPLACE VIEW {quote_ident(view_name)} AS SELECT * FROM read_parquet('{p}')"
+
+    def _execute_ddl(self, statements: List[str]) -> None:
+        # One script and one catalog commit for a whole mount or unmount;
+        # a failure rolls back so no half-registered views are left behind.
+        if not statements:
+            return
+        try:
+            self.con.execute("BEGIN TRANSACTION;\n" + ";\n".join(statements) + ";\nCOMMIT;")
+        except Exception:
+            try:
+                self.con.execute("ROLLBACK")
+            except duckdb.Error:
+                pass
+            raise
+
+    @staticmethod
+    def _span_int_sql(col: str) -> str:
+        """SQL for int(col) as Python applies it, NULL where int() would raise.
+
+        Floats and decimals truncate toward zero (a bare cast would round),
+        and strings must spell an integer (a bare cast accepts '10.6').
+        """
+        return (
+            f"CASE WHEN typeof({col}) IN ('TINYINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'HUGEINT', "
+            f"'UTINYINT', 'USMALLINT', 'UINTEGER', 'UBIGINT', 'UHUGEINT', 'BOOLEAN') "
+            f"THEN TRY_CAST({col} AS BIGINT) "
+            f"WHEN typeof({col}) IN ('FLOAT', 'DOUBLE') OR typeof({col}) LIKE 'DECIMAL%' "
+            f"THEN TRY_CAST(trunc(TRY_CAST({col} AS DOUBLE)) AS BIGINT) "
+            f"WHEN regexp_full_match(CAST({col} AS VARCHAR), '\\s*[+-]?[0-9]+\\s*') "
+            f"THEN TRY_CAST(trim(CAST({col} AS VARCHAR)) AS BIGINT) END"
+        )
+
     def _verify_span_bounds(self, shard_dir: Path, manifest: Dict[str, Any]) -> None:
         """Verify that spans.parquet byte ranges stay within their referenced content files.
 
@@ -192,40 +290,52 @@ class SpectraEngine:
                 raise ValueError(f"PROVENANCE_OUT_OF_BOUNDS: source file missing for hash {h}: {fp}")
             hash_to_size[h] = fp.stat().st_size
 
-        # Read spans using DuckDB (no pyarrow dependency).
+        # Let DuckDB scan spans.parquet and return only the first offending
+        # row in file order, i.e. the row a row-by-row check would stop at.
+        # The error is raised from the values DuckDB flagged, so the integer
+        # conversion is the same one the filter used.
         con = duckdb.connect(":memory:")
         try:
-            rows = con.execute(
-                "SELECT source_hash, byte_start, byte_end FROM read_parquet(?)",
+            con.execute("CREATE TABLE sizes (source_hash VARCHAR, size BIGINT)")
+            if hash_to_size:
+                con.executemany("INSERT INTO sizes VALUES (?, ?)", list(hash_to_size.items()))
+            row = con.execute(
+                f"""
+                SELECT source_hash, byte_start, byte_end, bs, be, size FROM (
+                    SELECT s.file_row_number, s.source_hash, s.byte_start, s.byte_end, z.size,
+                           {self._span_int_sql("s.byte_start")} AS bs,
+                           {self._span_int_sql("s.byte_end")} AS be
+                    FROM read_parquet(?, file_row_number = true) s
+                    LEFT JOIN sizes z ON s.source_hash = z.source_hash
+                )
+                WHERE size IS NULL OR bs IS NULL OR be IS NULL
+                   OR bs < 0 OR be < bs OR bs > size OR be > size
+                ORDER BY file_row_number
+                LIMIT 1
+                """,
                 [str(spans_path)],
-            ).fetchall()
+            ).fetchone()
         finally:
             con.close()
 
-        for source_hash, byte_start, byte_end in rows:
-            if not isinstance(source_hash, str) or source_hash not in hash_to_size:
-                raise ValueError(f"PROVENANCE_OUT_OF_BOUNDS: unknown source_hash in spans.parquet: {source_hash}")
-
-            try:
-                bs = int(byte_start)
-                be = int(byte_end)
-            except Exception:
-                raise ValueError(
-                    f"PROVENANCE_OUT_OF_BOUNDS: non-integer byte range for source_hash {source_hash}: "
-                    f"{byte_start}..{byte_end}"
-                )
-
-            if bs < 0 or be < 0 or be < bs:
-                raise ValueError(
-                    f"PROVENANCE_OUT_OF_BOUNDS: invalid byte range for source_hash {source_hash}: {bs}..{be}"
-                )
-
-            size = hash_to_size[source_hash]
-            if bs > size or be > size:
-                raise ValueError(
-                    f"PROVENANCE_OUT_OF_BOUNDS: span exceeds source bounds for source_hash {source_hash}: "
-                    f"{bs}..{be} (size {size})"
-                )
+        if row is None:
+            return
+        source_hash, byte_start, byte_end, bs, be, size = row
+        if size is None:
+            raise ValueError(f"PROVENANCE_OUT_OF_BOUNDS: unknown source_hash in spans.parquet: {source_hash}")
+        if bs is None or be is None:
+            raise ValueError(
+                f"PROVENANCE_OUT_OF_BOUNDS: non-integer byte range for source_hash {source_hash}: "
+                f"{byte_start}..{byte_end}"
+            )
+        if bs < 0 or be < bs:
+            raise ValueError(
+                f"PROVENANCE_OUT_OF_BOUNDS: invalid byte range for source_hash {source_hash}: {bs}..{be}"
+            )
+        raise ValueError(
+            f"PROVENANCE_OUT_OF_BOUNDS: span exceeds source bounds for source_hash {source_hash}: "
+            f"{bs}..{be} (size {size})"
+        )
 
     def boot(self) -> Dict[str, Any]:
         """Rehydrate state from the System Catalog."""
@@ -235,59 +345,80 @@ class SpectraEngine:
 
         print(f"[Boot] Rehydrating {len(active)} mounts from {self._db_path}...", file=sys.stderr)
 
-        for row in active:
-            mid = row.get("mount_id")
-            try:
-                cfg = row.get("mount_config") or {}
-                transport = cfg.get("transport")
-                if not transport:
-                    # Back-compat: treat missing config as genesis.
-                    transport = "genesis"
-
-                secret_b64: Optional[str] = None
-                if transport == "clarion":
-                    if not row.get("enc_secret"):
-                        raise ValueError("Missing secret for Clarion transport")
-                    secret_b64 = self.catalog.decrypt_secret(row["enc_secret"])
-
-                source_path = row.get("shard_path")
-                if not source_path or not Path(source_path).exists():
-                    raise ValueError(f"Shard path not found: {source_path}")
-
-                self.mount_shard(
-                    source_path,
-                    secret_b64,
-                    origin="boot",
-                    forced_transport=transport,
-                )
+        # Verification and span checks run outside self._lock, so independent
+        # mounts overlap; view registration still serializes on its write side.
+        if active:
+            with ThreadPoolExecutor(max_workers=min(_BOOT_WORKERS, len(active))) as ex:
+                outcomes = list(ex.map(self._boot_mount, active))
+        else:
+            outcomes = []
 
+        for row, err in zip(active, outcomes):
+            mid = row.get("mount_id")
+            if err is None:
                 results["success"] += 1
                 results["details"].append({"mount_id": mid, "status": "ok"})
-            except Exception as e:
-                if mid:
-                    self.catalog.set_mount_error(mid, str(e))
-                self.catalog.log_system_event("boot_mount_fail", details={"mount_id": mid, "error": str(e)})
-                results["failed"] += 1
-                results["details"].append({"mount_id": mid, "status": "error", "msg": str(e)})
-                print(f"[Boot] Failed to mount {mid}: {e}", file=sys.stderr)
+                continue
+            if mid:
+                self.catalog.set_mount_error(mid, err)
+            self.catalog.log_system_event("boot_mount_fail", details={"mount_id": mid, "error": err})
+            results["failed"] += 1
+            results["details"].append({"mount_id": mid, "status": "error", "msg": err})
+            print(f"[Boot] Failed to mount {mid}: {err}", file=sys.stderr)
 
         self.catalog.log_system_event("boot_complete", details=results)
+        self.catalog.flush()
         return results
 
+    def _boot_mount(self, row: Dict[str, Any]) -> Optional[str]:
+        """Remount one catalog row. Returns the error message, or None on success."""
+        try:
+            cfg = row.get("mount_config") or {}
+            transport = cfg.get("transport")
+            if not transport:
+                # Back-compat: treat missing config as genesis.
+                transport = "genesis"
+
+            secret_b64: Optional[str] = None
+            if transport == "clarion":
+                if not row.get("enc_secret"):
+                    raise ValueError("Missing secret for Clarion transport")
+                secret_b64 = self.catalog.decrypt_secret(row["enc_secret"])
+
+            source_path = row.get("shard_path")
+            if not source_path or not Path(source_path).exists():
+                raise ValueError(f"Shard path not found: {source_path}")
+
+            self.mount_shard(
+                source_path,
+                secret_b64,
+                origin="boot",
+                forced_transport=transport,
+            )
+            return None
+        except Exception as e:
+            return str(e)
+
     def health(self) -> Dict[str, Any]:
         ok, err = self.catalog.check_health()
         return {
             "status": "online" if ok else "degraded",
-            "uptime_sec": int(time.time() - self._start_time),
+            "uptime_sec": (_pc_ns() - self._start_ns) // 1_000_000_000,
             "catalog_connected": ok,
             "catalog_error": err,
             "active_mounts": len(self._mount_specs),
             "index_size": self.index_size(),
         }
 
+    def close(self) -> None:
+        """Flush and close the audit log, the System Catalog and DuckDB."""
+        self._audit.close()
+        self.catalog.close()
+        self.con.close()
+
     def index_size(self) -> int:
-        with self._lock:
-            return self._index.size()
+        with self._lock.read():
+            return self._index.size
 
     def mount_shard(
         self,
@@ -297,7 +428,7 @@ class SpectraEngine:
         origin: str = "api",
         forced_transport: Optional[str] = None,
     ) -> MountSpec:
-        start_ts = time.time()
+        start_ns = _pc_ns()
 
         transport = forced_transport or TransportAdapter.detect_format(path)
 
@@ -326,7 +457,7 @@ class SpectraEngine:
             self._verify_constitution(target_dir)
 
             manifest_path = target_dir / "manifest.json"
-            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            manifest = _loads(manifest_path.read_bytes())
 
             spec_version = manifest.get("spec_version")
             if spec_version != "1.0.0":
@@ -343,11 +474,13 @@ class SpectraEngine:
             # Additional hard gate: provenance spans must stay within the bounds of their sources.
             self._verify_span_bounds(target_dir, manifest)
 
+            # Keep stdlib json here: mount_id is a uuid5 of this exact string, and
+            # orjson's compact separators would change every persisted mount_id.
             mount_key = json.dumps({"shard_id": shard_id, "merkle_root": merkle_root}, sort_keys=True)
             mount_id = str(uuid.uuid5(self._NAMESPACE, mount_key))
             mount_prefix = mount_id.replace("-", "")[:12]
 
-            with self._lock:
+            with self._lock.write():
                 if mount_id in self._mount_specs:
                     # Drop decrypted bytes from disk if we created them.
                     if temp_dir and temp_dir.exists():
@@ -356,27 +489,19 @@ class SpectraEngine:
 
                 # Load Parquet tables into DuckDB views.
                 tables: List[str] = []
-                claims_for_mount: List[Dict[str, Any]] = []
+                ddl: List[str] = []
+
+                view_suffix = f"__{mount_prefix}__{sanitize_identifier(shard_id)}"
 
                 # Register views for all standard shard tables.
-                _SHARD_TABLES = [
-                    ("graph/claims.parquet", "claims", True),
-                    ("graph/entities.parquet", "entities", False),
-                    ("graph/provenance.parquet", "provenance", False),
-                    ("evidence/spans.parquet", "spans", False),
-                ]
-
-                for rel_path, table_name, required in _SHARD_TABLES:
+                for rel_path, table_name, required in self._SHARD_TABLES:
                     pq_path = target_dir / rel_path
                     if not pq_path.exists():
                         if required:
                             raise ValueError(f"Genesis shard missing required file: {rel_path}")
                         continue
-                    p = pq_path.as_posix().replace("'", "''")
-                    view_name = f"{table_name}__{mount_prefix}__{sanitize_identifier(shard_id)}"
-                    self.con.execute(
-                        f"CREATE OR REPLACE VIEW {quote_ident(view_name)} AS SELECT * FROM read_parquet('{p}')"
-                    )
+                    view_name = table_name + view_suffix
+                    ddl.append(self._parquet_view_sql(view_name, pq_path))
                     tables.append(view_name)
 
                 # Also register ext/ parquet files if present.
@@ -384,24 +509,20 @@ class SpectraEngine:
                 if ext_dir.is_dir():
                     for ext_file in sorted(ext_dir.iterdir()):
                         if ext_file.suffix == ".parquet" and ext_file.is_file():
-                            p = ext_file.as_posix().replace("'", "''")
-                            view_name = f"ext_{ext_file.stem}__{mount_prefix}__{sanitize_identifier(shard_id)}"
-                            self.con.execute(
-                                f"CREATE OR REPLACE VIEW {quote_ident(view_name)} AS SELECT * FROM read_parquet('{p}')"
-                            )
+                            view_name = f"ext_{ext_file.stem}" + view_suffix
+                            ddl.append(self._parquet_view_sql(view_name, ext_file))
                             tables.append(view_name)
 
-                # For indexing, pull claim rows as dicts (bounded by shard size in practice).
-                claims_view = f"claims__{mount_prefix}__{sanitize_identifier(shard_id)}"
-                try:
-                    rows = self.con.execute(f"SELECT * FROM {quote_ident(claims_view)}").fetchdf().to_dict("records")
-                    for r in rows:
-                        if isinstance(r, dict):
-                            r.setdefault("shard_id", shard_id)
-                            claims_for_mount.append(r)
-                except Exception:
-                    # Indexing is optional, SQL views remain valid.
-                    pass
+                # Rebuild cross-shard union views so queries can reference
+                # bare table names (claims, entities, temporal, lineage, refs)
+                # rather than per-shard view names. Shard views and unions
+                # are created in a single transaction.
+                all_views = {v for s in self._mount_specs.values() for v in s.tables}
+                all_views.update(tables)
+                ddl.extend(self._union_view_sql(all_views))
+                self._execute_ddl(ddl)
+
+                claims_view = "claims" + view_suffix
 
                 spec = MountSpec(
                     mount_id=mount_id,
@@ -417,12 +538,13 @@ class SpectraEngine:
                     self._mount_dirs[mount_id] = temp_dir
 
                 self._mount_specs[mount_id] = spec
-                self._claims[mount_id] = claims_for_mount
+                self._mount_ids_sorted = tuple(sorted(self._mount_specs))
+                self._claim_views[mount_id] = claims_view
 
-                # Rebuild cross-shard union views so queries can reference
-                # bare table names (claims, entities, temporal, lineage, refs)
-                # rather than per-shard view names.
-                self._rebuild_union_views()
+                if origin == "boot":
+                    # Vectors saved by an earlier index() come back with the
+                    # mount; shards never indexed stay out of the index.
+                    self._index.load_owner(mount_id, self._vector_file(merkle_root))
 
                 # Persist to catalog.
                 self.catalog.upsert_mount(
@@ -445,7 +567,7 @@ class SpectraEngine:
                         "shard_id": shard_id,
                         "transport": transport,
                         "tables_created": len(tables),
-                        "latency_ms": int((time.time() - start_ts) * 1000),
+                        "latency_ms": (_pc_ns() - start_ns) // 1_000_000,
                     }
                 )
 
@@ -462,7 +584,11 @@ class SpectraEngine:
 
     def mount(self, path: str, secret_b64: Optional[str], *, verify: bool = True, token_hash: Optional[str] = None) -> Dict[str, Any]:
         # verify flag remains for API compatibility. Constitution verification always runs.
-        spec = self.mount_shard(path, secret_b64, token_hash=token_hash, origin="api")
+        try:
+            spec = self.mount_shard(path, secret_b64, token_hash=token_hash, origin="api")
+        finally:
+            # mount_ok/mount_fail are committed before the caller sees the result.
+            self.catalog.flush()
         return {
             "status": "ok",
             "mount_id": spec.mount_id,
@@ -473,8 +599,9 @@ class SpectraEngine:
             "verify": {"status": "ok"} if verify else None,
         }
 
-    def _rebuild_union_views(self) -> None:
-        """Rebuild cross-shard union views after any mount/unmount.
+    @staticmethod
+    def _union_view_sql(all_views: set) -> List[str]:
+        """Statements that rebuild cross-shard union views after any mount/unmount.
 
         Creates bare table names (claims, entities, temporal, lineage, refs,
         provenance, spans) as UNION ALL across all mounted shards.
@@ -496,51 +623,46 @@ class SpectraEngine:
             ("refs",     "ext_references"),
         ]
 
-        all_views = {v for s in self._mount_specs.values() for v in s.tables}
-
-        for bare_name, prefix in core_tables:
+        ordered = sorted(all_views)
+        statements: List[str] = []
+        for bare_name, prefix in core_tables + ext_tables:
             parts = [f'SELECT * FROM {quote_ident(v)}'
-                     for v in sorted(all_views)
+                     for v in ordered
                      if v.startswith(f"{prefix}__")]
-            self.con.execute(f"DROP VIEW IF EXISTS {quote_ident(bare_name)}")
+            statements.append(f"DROP VIEW IF EXISTS {quote_ident(bare_name)}")
             if parts:
-                self.con.execute(
-                    f"CREATE VIEW {quote_ident(bare_name)} AS {' UNION ALL '.join(parts)}"
-                )
-
-        for bare_name, prefix in ext_tables:
-            parts = [f'SELECT * FROM {quote_ident(v)}'
-                     for v in sorted(all_views)
-                     if v.startswith(f"{prefix}__")]
-            self.con.execute(f"DROP VIEW IF EXISTS {quote_ident(bare_name)}")
-            if parts:
-                self.con.execute(
+                statements.append(
                     f"CREATE VIEW {quote_ident(bare_name)} AS {' UNION ALL '.join(parts)}"
                 )
+        return statements
 
     def unmount(self, mount_id: str, token_hash: Optional[str] = None) -> None:
-        with self._lock:
+        with self._lock.write():
             spec = self._mount_specs.pop(mount_id, None)
-            self._claims.pop(mount_id, None)
+            self._mount_ids_sorted = tuple(sorted(self._mount_specs))
+            self._claim_views.pop(mount_id, None)
+            self._index.remove_owner(mount_id)
             if not spec:
                 return
 
-            for t in spec.tables:
-                self.con.execute(f"DROP VIEW IF EXISTS {quote_ident(t)}")
+            # Rebuild union views to exclude the unmounted shard, then drop
+            # its own views, all in one transaction.
+            all_views = {v for s in self._mount_specs.values() for v in s.tables}
+            ddl = self._union_view_sql(all_views)
+            ddl.extend(f"DROP VIEW IF EXISTS {quote_ident(t)}" for t in spec.tables)
+            self._execute_ddl(ddl)
 
             temp_dir = self._mount_dirs.pop(mount_id, None)
             if temp_dir and temp_dir.exists():
                 shutil.rmtree(temp_dir)
 
-            # Rebuild union views to exclude the unmounted shard
-            self._rebuild_union_views()
-
             self.catalog.set_mount_stopped(mount_id)
             self.catalog.log_system_event("unmount", details={"mount_id": mount_id})
             self._audit.write_event({"event": "unmount", "token_hash": token_hash, "mount_id": mount_id})
+        self.catalog.flush()
 
     def catalog_json(self) -> Dict[str, Any]:
-        with self._lock:
+        with self._lock.read():
             mounts = []
             for s in sorted(self._mount_specs.values(), key=lambda m: (m.shard_id, m.mount_id)):
                 mounts.append(
@@ -556,36 +678,74 @@ class SpectraEngine:
             return {"mounts": mounts}
 
     def query_json(self, sql: str, *, token_hash: Optional[str] = None) -> Dict[str, Any]:
-        start = time.perf_counter()
+        start_ns = _pc_ns()
         if not is_read_only_sql(sql):
             raise ValueError("Query rejected. Read-only SQL only.")
 
-        with self._lock:
-            res = self.con.execute(sql)
-            rows = res.fetchall()
-            cols = [d[0] for d in (res.description or [])]
+        with self._lock.read():
+            # A cursor per query lets concurrent readers run in parallel
+            # instead of serializing on the shared connection.
+            cur = self.con.cursor()
+            try:
+                res = cur.execute(sql)
+                rows = res.fetchall()
+                cols = [d[0] for d in (res.description or [])]
+            finally:
+                cur.close()
 
-        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        elapsed_ms = (_pc_ns() - start_ns) // 1_000_000
         self._audit.write_event(
             {
                 "event": "sql_query",
                 "token_hash": token_hash,
-                "sql_hash": sha256_hex(sql)[:16],
+                "sql_hash": fingerprint_hex(sql),
                 "row_count": len(rows),
                 "elapsed_ms": elapsed_ms,
-                "active_mounts": sorted(list(self._mount_specs.keys())),
+                "active_mounts": self._mount_ids_sorted,
             }
         )
         return {"columns": cols, "rows": rows}
 
+    def _vector_file(self, merkle_root: str) -> Path:
+        emb = self._embedder
+        key = f"{sanitize_identifier(merkle_root)}__{sanitize_identifier(emb.model)}_{emb.dimension}"
+        return self._vector_dir / f"{key}.npy"
+
     def index(self, mount_id: Optional[str] = None, token_hash: Optional[str] = None) -> Dict[str, Any]:
-        start = time.time()
-        with self._lock:
-            targets = [mount_id] if mount_id else list(self._claims.keys())
+        start_ns = _pc_ns()
+        with self._lock.write():
+            targets = [mount_id] if mount_id else list(self._claim_views.keys())
             total_added = 0
             for mid in targets:
-                claims = self._claims.get(mid, [])
-                total_added += self._index.index_claims(claims)
+                view = self._claim_views.get(mid)
+                if view is None:
+                    continue
+                # Re-indexing a mount replaces its rows instead of duplicating them.
+                self._index.remove_owner(mid)
+
+                # Vectors are a pure function of shard content and embedder, so
+                # a saved matrix for this merkle root skips re-embedding.
+                vec_file = self._vector_file(self._mount_specs[mid].merkle_root)
+                loaded = self._index.load_owner(mid, vec_file)
+                if loaded is not None:
+                    total_added += loaded
+                    continue
+
+                try:
+                    cur = self.con.execute(f"SELECT * FROM {quote_ident(view)}")
+                except duckdb.CatalogException:
+                    # Indexing is optional, SQL views remain valid.
+                    continue
+                if pyarrow is not None:
+                    total_added += self._index.index_arrow(cur.fetch_arrow_table(), owner=mid)
+                else:
+                    cols = [d[0] for d in cur.description]
+                    rows = [dict(zip(cols, r)) for r in cur.fetchall()]
+                    total_added += self._index.index_claims(rows, owner=mid)
+                try:
+                    self._index.save_owner(mid, vec_file)
+                except OSError as e:
+                    print(f"[Index] Could not persist vectors for {mid}: {e}", file=sys.stderr)
 
         self._audit.write_event(
             {
@@ -593,15 +753,15 @@ class SpectraEngine:
                 "token_hash": token_hash,
                 "targets": targets,
                 "added_count": total_added,
-                "latency_ms": int((time.time() - start) * 1000),
+                "latency_ms": (_pc_ns() - start_ns) // 1_000_000,
             }
         )
-        return {"status": "ok", "indexed": total_added, "index_size": self._index.size()}
+        return {"status": "ok", "indexed": total_added, "index_size": self._index.size}
 
     def chat(self, question: str, top_k: int = 7, token_hash: Optional[str] = None) -> Dict[str, Any]:
-        start = time.time()
-        with self._lock:
-            active_mounts = sorted(list(self._mount_specs.keys()))
+        start_ns = _pc_ns()
+        with self._lock.read(), self._chat_lock:
+            active_mounts = self._mount_ids_sorted
             res = self._chat.ask(question, top_k=top_k)
 
         self._audit.write_event(
@@ -609,9 +769,9 @@ class SpectraEngine:
                 "event": "chat_query",
                 "token_hash": token_hash,
                 "active_mounts": active_mounts,
-                "question_hash": sha256_hex(question)[:16],
+                "question_hash": fingerprint_hex(question),
                 "citations_count": len(res.get("citations", [])),
-                "latency_ms": int((time.time() - start) * 1000),
+                "latency_ms": (_pc_ns() - start_ns) // 1_000_000,
             }
         )
         return res
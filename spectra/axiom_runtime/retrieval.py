@@ -11,8 +11,26 @@ for queries that don't map well to keyword SQL.
 """
 from __future__ import annotations
 
+import functools
+import heapq
+import json
+import math
+import os
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None  # type: ignore
+
+
+@functools.lru_cache(maxsize=100_000)
+def _embed_cached(model: str, dim: int, text: str) -> Tuple[float, ...]:
+    """Embedding for (model, dim, text); tuples so cached values stay immutable."""
+    # Stub: return zero vector
+    return (0.0,) * dim
+
 
 class Embedder:
     """Compute text embeddings for semantic search.
@@ -28,7 +46,13 @@ class Embedder:
         model: str = "stub",
         dim: int = 384,
         cache_path: Optional[str] = None,
+        provider: str = "stub",
+        base_url: Optional[str] = None,
     ) -> None:
+        # provider/base_url select the embedding backend; the stub keeps
+        # them so SpectraEngine's configuration is accepted and visible.
+        self._provider = provider
+        self._base_url = base_url
         self._model = model
         self._dim = dim
         self._cache_path = cache_path
@@ -36,12 +60,26 @@ class Embedder:
 
     def embed(self, text: str) -> List[float]:
         """Return an embedding vector for the given text."""
-        # Stub: return zero vector
-        return [0.0] * self._dim
+        return list(_embed_cached(self._model, self._dim, text))
+
+    def embed_batch(self, texts: List[str]) -> Any:
+        """Return embedding vectors for a batch of texts.
+
+        A (len(texts), dim) float32 array when NumPy is installed,
+        otherwise a list of lists.
+        """
+        rows = [_embed_cached(self._model, self._dim, t) for t in texts]
+        if np is None:
+            return [list(r) for r in rows]
+        return np.array(rows, dtype=np.float32).reshape(len(rows), self._dim)
+
+    @property
+    def provider(self) -> str:
+        return self._provider
 
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Return embedding vectors for a batch of texts."""
-        return [self.embed(t) for t in texts]
+    @property
+    def model(self) -> str:
+        return self._model
 
     @property
     def dimension(self) -> int:
@@ -52,39 +90,253 @@ class Embedder:
         return self._ready
 
 
+# Claim fields used as embedding text: evidence, else "subject predicate object".
+_CLAIM_TEXT_COLUMNS = ("evidence", "subject", "predicate", "object")
+
+
+def _grown(arr: Any, n: int, shape: Tuple[int, ...], dtype: Any) -> Any:
+    """New array of `shape` holding the first n rows of arr (which may be None)."""
+    out = np.empty(shape, dtype=dtype)
+    if n:
+        out[:n] = arr[:n]
+    return out
+
+
 class VectorIndex:
     """In-memory vector index for nearest-neighbor search over claims.
 
-    Stub implementation that returns empty results. When a real
-    Embedder is provided, this builds a brute-force or HNSW index
-    over claim evidence text for semantic retrieval.
+    Vectors are L2-normalized on insert and kept in one contiguous
+    (capacity, dim) float32 matrix that grows by doubling, with claim IDs
+    in a parallel list, so search is a single matrix-vector product plus
+    a partial sort. Falls back to plain lists when NumPy is unavailable.
+
+    With quantize=True, rows are stored as int8 with a per-row float32
+    scale (4x less memory) and dequantized block by block during search.
+
+    Rows indexed with an owner (the engine passes the mount ID) can be
+    dropped with remove_owner(); they are tombstoned and excluded from
+    search, and the storage is compacted once over a quarter is dead.
     """
 
-    def __init__(self, embedder: Embedder) -> None:
+    _INITIAL_CAPACITY = 4096
+    _DEQUANT_BLOCK = 65536
+
+    def __init__(self, embedder: Embedder, *, quantize: bool = False) -> None:
         self._embedder = embedder
-        self._vectors: List[Tuple[str, List[float]]] = []
+        self._quantize = quantize and np is not None
+        self._ids: List[str] = []
+        self._owners: List[Optional[str]] = []
+        self._vecs: Any = None  # np.ndarray (capacity, dim) or List[List[float]]
+        self._scales: Any = None  # np.ndarray (capacity,) when quantized
+        self._live: Any = None  # np.ndarray (capacity,) bool or List[bool]
+        self._dead = 0
         self._metadata: Dict[str, Any] = {}
 
     def add(self, claim_id: str, text: str, metadata: Optional[Dict] = None) -> None:
         """Add a claim's evidence text to the index."""
-        vec = self._embedder.embed(text)
-        self._vectors.append((claim_id, vec))
+        self._append([claim_id], [self._embedder.embed(text)])
         if metadata:
             self._metadata[claim_id] = metadata
 
+    def index_claims(self, claims: List[Dict[str, Any]], owner: Optional[str] = None) -> int:
+        """Embed and index claim rows in one batch. Returns the number added."""
+        cols = {k: [c.get(k) for c in claims] for k in _CLAIM_TEXT_COLUMNS}
+        return self._index_columns([c.get("claim_id") for c in claims], cols, owner)
+
+    def index_arrow(self, table: Any, owner: Optional[str] = None) -> int:
+        """Index a claims Arrow table column-wise, without building row dicts."""
+        names = set(table.column_names)
+        if "claim_id" not in names:
+            return 0
+        n = table.num_rows
+        cols = {
+            k: (table.column(k).to_pylist() if k in names else [None] * n)
+            for k in _CLAIM_TEXT_COLUMNS
+        }
+        return self._index_columns(table.column("claim_id").to_pylist(), cols, owner)
+
+    def _index_columns(
+        self, claim_ids: List[Any], cols: Dict[str, List[Any]], owner: Optional[str],
+    ) -> int:
+        ids: List[str] = []
+        texts: List[str] = []
+        evidence, subj, pred, obj = (cols[k] for k in _CLAIM_TEXT_COLUMNS)
+        for i, claim_id in enumerate(claim_ids):
+            if not claim_id:
+                continue
+            ids.append(claim_id)
+            texts.append(evidence[i] or " ".join(
+                str(v or "") for v in (subj[i], pred[i], obj[i])))
+        if ids:
+            self._append(ids, self._embedder.embed_batch(texts), owner)
+        return len(ids)
+
+    def save_owner(self, owner: str, path: Path) -> bool:
+        """Write the live rows of `owner` to path (.npy) plus a .ids.json sidecar.
+
+        Rows are saved normalized and dequantized. Returns False without
+        NumPy. Both files are written to temp names and renamed into place.
+        """
+        if np is None:
+            return False
+        rows = [i for i, o in enumerate(self._owners) if o == owner and self._live[i]]
+        sel = np.asarray(rows, dtype=np.intp)
+        dim = self._vecs.shape[1] if self._vecs is not None else self._embedder.dimension
+        vecs = self._vecs[sel].astype(np.float32) if rows else np.empty((0, dim), np.float32)
+        if self._scales is not None and rows:
+            vecs *= self._scales[sel][:, None]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ids_path = path.with_suffix(".ids.json")
+        with open(f"{path}.tmp", "wb") as f:
+            np.save(f, vecs)
+        Path(f"{ids_path}.tmp").write_text(json.dumps([self._ids[i] for i in rows]), encoding="utf-8")
+        os.replace(f"{ids_path}.tmp", ids_path)
+        os.replace(f"{path}.tmp", path)
+        return True
+
+    def load_owner(self, owner: str, path: Path) -> Optional[int]:
+        """Append rows saved by save_owner() under `owner`, memory-mapping the
+        vectors. Returns the number loaded, or None if nothing usable is there.
+        """
+        ids_path = path.with_suffix(".ids.json")
+        if np is None or not path.exists() or not ids_path.exists():
+            return None
+        try:
+            ids = json.loads(ids_path.read_text(encoding="utf-8"))
+            vecs = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if vecs.ndim != 2 or len(vecs) != len(ids) or vecs.shape[1] != self._embedder.dimension:
+            return None
+        if ids:
+            self._append(ids, vecs, owner)
+        return len(ids)
+
+    def remove_owner(self, owner: str) -> int:
+        """Tombstone every live row indexed under `owner`. Returns the count removed."""
+        removed = 0
+        for i, o in enumerate(self._owners):
+            if o == owner and self._live[i]:
+                self._live[i] = False
+                removed += 1
+        self._dead += removed
+        if self._dead and self._dead * 4 > len(self._ids):
+            self._compact()
+        return removed
+
+    def _compact(self) -> None:
+        n = len(self._ids)
+        keep = [i for i in range(n) if self._live[i]]
+        self._ids = [self._ids[i] for i in keep]
+        self._owners = [self._owners[i] for i in keep]
+        if np is None:
+            self._vecs = [self._vecs[i] for i in keep]
+            self._live = [True] * len(keep)
+        else:
+            m = len(keep)
+            sel = np.asarray(keep, dtype=np.intp)
+            self._vecs[:m] = self._vecs[sel]
+            if self._scales is not None:
+                self._scales[:m] = self._scales[sel]
+            self._live[:m] = True
+        self._dead = 0
+
+    def _append(self, ids: List[str], vecs: Any, owner: Optional[str] = None) -> None:
+        n = len(self._ids)
+        self._owners.extend([owner] * len(ids))
+        if np is None:
+            if self._vecs is None:
+                self._vecs = []
+                self._live = []
+            for v in vecs:
+                norm = math.sqrt(sum(x * x for x in v))
+                self._vecs.append([x / norm for x in v] if norm else list(v))
+            self._live.extend([True] * len(ids))
+            self._ids.extend(ids)
+            return
+
+        block = np.asarray(vecs, dtype=np.float32).reshape(len(ids), -1)
+        if not block.flags.writeable:
+            block = block.copy()
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        np.divide(block, norms, out=block, where=norms > 0)
+        scales = None
+        if self._quantize:
+            scales = np.abs(block).max(axis=1) / 127
+            q = np.zeros_like(block)
+            np.divide(block, scales[:, None], out=q, where=scales[:, None] > 0)
+            block = np.rint(q).astype(np.int8)
+
+        need = n + len(ids)
+        if self._vecs is None or need > self._vecs.shape[0]:
+            cap = max(self._INITIAL_CAPACITY, need,
+                      2 * (0 if self._vecs is None else self._vecs.shape[0]))
+            self._vecs = _grown(self._vecs, n, (cap, block.shape[1]), block.dtype)
+            self._live = _grown(self._live, n, (cap,), np.bool_)
+            if scales is not None:
+                self._scales = _grown(self._scales, n, (cap,), np.float32)
+        self._vecs[n:need] = block
+        self._live[n:need] = True
+        if scales is not None:
+            self._scales[n:need] = scales
+        self._ids.extend(ids)
+
     def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
-        """Return the top-k most similar claim IDs with scores.
+        """Return the top-k claim IDs by cosine similarity, best first.
 
-        Stub: returns empty list. Real implementation would compute
-        cosine similarity against all indexed vectors.
+        Returns an empty list when the index is empty or the query
+        embedding is all zeros (as with the stub Embedder).
         """
-        return []
+        n = len(self._ids)
+        live = n - self._dead
+        if live == 0 or top_k <= 0:
+            return []
+        qv = self._embedder.embed(query)
+        k = min(top_k, live)
+
+        if np is None:
+            qnorm = math.sqrt(sum(x * x for x in qv))
+            if not qnorm:
+                return []
+            # -i breaks ties toward earlier rows, matching the stable NumPy sort.
+            scored = ((sum(a * b for a, b in zip(v, qv)) / qnorm, -i)
+                      for i, v in enumerate(self._vecs) if self._live[i])
+            return [(self._ids[-neg_i], score) for score, neg_i in heapq.nlargest(k, scored)]
+
+        q = np.asarray(qv, dtype=np.float32)
+        qnorm = float(np.linalg.norm(q))
+        if not qnorm:
+            return []
+        q = q / qnorm
+        if self._scales is None:
+            scores = self._vecs[:n] @ q
+        else:
+            scores = np.empty(n, dtype=np.float32)
+            for lo in range(0, n, self._DEQUANT_BLOCK):
+                hi = min(n, lo + self._DEQUANT_BLOCK)
+                scores[lo:hi] = (self._vecs[lo:hi].astype(np.float32) @ q) * self._scales[lo:hi]
+        if self._dead:
+            scores[~self._live[:n]] = -np.inf
+        # Negate in place once so both selection steps are ascending and
+        # no temporary -scores arrays are allocated. O(n) select + O(k log k).
+        np.negative(scores, out=scores)
+        if k < n:
+            idx = np.argpartition(scores, k - 1)[:k]
+        else:
+            idx = np.arange(n)
+        idx = idx[np.argsort(scores[idx], kind="stable")]
+        return [(self._ids[i], float(-scores[i])) for i in idx]
 
     def clear(self) -> None:
         """Remove all indexed vectors."""
-        self._vectors.clear()
+        self._ids.clear()
+        self._owners.clear()
+        self._vecs = None
+        self._scales = None
+        self._live = None
+        self._dead = 0
         self._metadata.clear()
 
     @property
     def size(self) -> int:
-        return len(self._vectors)
+        return len(self._ids) - self._dead
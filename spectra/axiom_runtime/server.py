@@ -25,6 +25,11 @@ def startup_event():
         )
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    engine.close()
+
+
 class MountRequest(BaseModel):
     path: str
     secret: Optional[str] = None
@@ -1,8 +1,12 @@
-import re
-
-_READONLY_RE = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+_READONLY_KEYWORDS = ("select", "with")
 
 def is_read_only_sql(sql: str) -> bool:
     if not isinstance(sql, str):
         return False
-    return bool(_READONLY_RE.match(sql))
+    # Leading keyword followed by a word boundary, same as ^\s*(select|with)\b.
+    head = sql.lstrip()[:7].lower()
+    for kw in _READONLY_KEYWORDS:
+        if head.startswith(kw):
+            nxt = head[len(kw):len(kw) + 1]
+            return not (nxt.isalnum() or nxt == "_")
+    return False
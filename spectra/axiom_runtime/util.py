@@ -1,18 +1,37 @@
-import hashlib
 import os
 import re
 import tempfile
+import threading
+from contextlib import contextmanager
+from hashlib import blake2b as _blake2b
+from hashlib import sha256 as _sha256
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
 
-_SAFE_IDENT_RE = re.compile(r"[^a-zA-Z0-9_]+")
+_SAFE_IDENT_RE = re.compile(r"[^a-zA-Z0-9_]+", re.ASCII)
+# ASCII fast path for sanitize_identifier: disallowed bytes map to NUL, and
+# each NUL run then becomes one "_" exactly like the regex substitution.
+_IDENT_TABLE = bytes(
+    c if (48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122 or c == 95) else 0 for c in range(256)
+)
 
 def sha256_hex(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    # Fingerprints for caches and audit records only, never a security boundary.
+    return _sha256(s.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+def fingerprint_hex(s: str) -> str:
+    # 64-bit blake2b for audit fields such as sql_hash; same 16-hex width
+    # as the truncated SHA-256 it replaces, without the full digest.
+    return _blake2b(s.encode("utf-8"), digest_size=8).hexdigest()
 
 def sanitize_identifier(s: str) -> str:
     s = str(s).strip()
-    s = _SAFE_IDENT_RE.sub("_", s)
+    if s.isascii():
+        b = s.encode("ascii").translate(_IDENT_TABLE)
+        if b"\0" in b:
+            s = b"_".join([p for p in b.split(b"\0") if p]).decode("ascii")
+    else:
+        s = _SAFE_IDENT_RE.sub("_", s)
     s = s.strip("_")
     if not s:
         return "x"
@@ -30,3 +49,72 @@ def choose_temp_root() -> Tuple[Path, str]:
             p.mkdir(parents=True, exist_ok=True)
             return p, f"env:{env}"
     return Path(tempfile.gettempdir()).resolve(), "system"
+
+
+class RWLock:
+    """Writer-preferring reader/writer lock.
+
+    Any number of readers may hold the lock together; a writer waits for
+    them to leave and blocks new readers while it waits. Reads nest inside
+    reads or a write on the same thread, and writes nest inside writes.
+    Upgrading a read to a write is not supported.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer: int = 0
+        self._write_depth = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        depth = getattr(self._local, "depth", 0)
+        if depth or self._writer == threading.get_ident():
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            try:
+                yield
+            finally:
+                self._write_depth -= 1
+            return
+        if getattr(self._local, "depth", 0):
+            raise RuntimeError("cannot upgrade a read lock to a write lock")
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = 0
+                self._cond.notify_all()
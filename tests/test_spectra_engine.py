@@ -0,0 +1,195 @@
+"""
+Tests for SpectraEngine (axiom_runtime.engine) against a small Genesis shard.
+
+The shard is written with DuckDB; constitution verification is bypassed
+since axm-verify is not a test dependency.
+
+Run:  python -m pytest tests/test_spectra_engine.py -v
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "spectra"))
+
+from axiom_runtime import engine as engine_module
+from axiom_runtime.engine import SpectraEngine
+
+
+_SOURCE = b"Tranexamic acid reduces bleeding in trauma patients."
+_MERKLE_ROOT = "ab" * 32
+
+
+def _write_parquet(path: Path, select_sql: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect(":memory:")
+    try:
+        con.execute(f"COPY ({select_sql}) TO '{path.as_posix()}' (FORMAT PARQUET)")
+    finally:
+        con.close()
+
+
+@pytest.fixture
+def shard(tmp_path: Path) -> Path:
+    root = tmp_path / "shard"
+    (root / "sig").mkdir(parents=True)
+    (root / "content").mkdir()
+    (root / "content" / "source.txt").write_bytes(_SOURCE)
+    manifest = {
+        "spec_version": "1.0.0",
+        "shard_id": "shard_test",
+        "integrity": {"merkle_root": _MERKLE_ROOT},
+        "sources": [{"hash": "h1", "path": "content/source.txt"}],
+    }
+    (root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    _write_parquet(
+        root / "graph" / "claims.parquet",
+        "SELECT * FROM (VALUES "
+        "('c1', 'tranexamic acid', 'reduces', 'bleeding', 'Tranexamic acid reduces bleeding'), "
+        "('c2', 'trial', 'enrolled', 'trauma patients', 'in trauma patients')"
+        ") t(claim_id, subject, predicate, object, evidence)",
+    )
+    _write_parquet(
+        root / "evidence" / "spans.parquet",
+        "SELECT * FROM (VALUES ('h1', 0, 32), ('h1', 33, 52)) t(source_hash, byte_start, byte_end)",
+    )
+    return root
+
+
+@pytest.fixture
+def make_engine(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("SPECTRA_DEV_MODE", "1")
+    monkeypatch.setattr(SpectraEngine, "_verify_constitution", lambda self, shard_dir: None)
+    engines = []
+
+    def make() -> SpectraEngine:
+        eng = SpectraEngine(
+            audit_path=str(tmp_path / "audit.jsonl"),
+            cache_path=str(tmp_path / "cache.jsonl"),
+            db_path=str(tmp_path / "spectra.db"),
+            temp_root=str(tmp_path / "tmp"),
+        )
+        engines.append(eng)
+        return eng
+
+    yield make
+    for eng in engines:
+        eng.close()
+
+
+def _events(tmp_path: Path) -> list:
+    # A separate connection sees only what the catalog has committed.
+    conn = sqlite3.connect(str(tmp_path / "spectra.db"))
+    try:
+        rows = conn.execute("SELECT event_type, details FROM system_events ORDER BY event_id").fetchall()
+    finally:
+        conn.close()
+    return [(event_type, json.loads(details)) for event_type, details in rows]
+
+
+class TestSystemEvents:
+
+    def test_mount_event_committed_on_return(self, shard, make_engine, tmp_path):
+        eng = make_engine()
+        mount_id = eng.mount(str(shard), None)["mount_id"]
+        assert _events(tmp_path)[-1] == ("mount_ok", {"mount_id": mount_id, "transport": "genesis"})
+
+        eng.unmount(mount_id)
+        assert _events(tmp_path)[-1] == ("unmount", {"mount_id": mount_id})
+
+    def test_mount_fail_committed_on_raise(self, shard, make_engine, tmp_path):
+        manifest = json.loads((shard / "manifest.json").read_text(encoding="utf-8"))
+        manifest["spec_version"] = "0.9.0"
+        (shard / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        eng = make_engine()
+        with pytest.raises(ValueError):
+            eng.mount(str(shard), None)
+        event_type, details = _events(tmp_path)[-1]
+        assert event_type == "mount_fail"
+        assert details["path"] == str(shard)
+
+    def test_boot_events_committed_on_return(self, make_engine, tmp_path):
+        make_engine().boot()
+        assert [e for e, _ in _events(tmp_path)] == ["boot_start", "boot_complete"]
+
+
+class TestSpanBounds:
+    # _SOURCE is 52 bytes; manifest sources map hash "h1" to it.
+
+    def _check(self, shard: Path, make_engine, select_sql: str) -> None:
+        _write_parquet(shard / "evidence" / "spans.parquet", select_sql)
+        manifest = json.loads((shard / "manifest.json").read_text(encoding="utf-8"))
+        make_engine()._verify_span_bounds(shard, manifest)
+
+    def test_float_offsets_truncate(self, shard, make_engine):
+        # int(52.9) == 52, so this span ends exactly at the source's end.
+        self._check(shard, make_engine, "SELECT 'h1' AS source_hash, 0.4::DOUBLE AS byte_start, 52.9::DOUBLE AS byte_end")
+        with pytest.raises(ValueError, match="exceeds source bounds.*0..53"):
+            self._check(shard, make_engine, "SELECT 'h1' AS source_hash, 0.0::DOUBLE AS byte_start, 53.0::DOUBLE AS byte_end")
+
+    def test_decimal_offsets_truncate(self, shard, make_engine):
+        self._check(shard, make_engine, "SELECT 'h1' AS source_hash, 1.5 AS byte_start, 52.5 AS byte_end")
+
+    def test_string_offsets_must_be_integers(self, shard, make_engine):
+        self._check(shard, make_engine, "SELECT 'h1' AS source_hash, ' 3 ' AS byte_start, '+9' AS byte_end")
+        with pytest.raises(ValueError, match="non-integer byte range"):
+            self._check(shard, make_engine, "SELECT 'h1' AS source_hash, '0' AS byte_start, '10.6' AS byte_end")
+
+    def test_first_offending_row_in_file_order(self, shard, make_engine):
+        with pytest.raises(ValueError, match="invalid byte range for source_hash h1: 8..3"):
+            self._check(
+                shard, make_engine,
+                "SELECT * FROM (VALUES ('h1', 0, 5, 1), ('h1', 8, 3, 2), ('a0', 0, 1, 3)) "
+                "t(source_hash, byte_start, byte_end, n) ORDER BY n",
+            )
+
+
+class TestVectorPersistence:
+
+    def test_index_saves_and_boot_reloads(self, shard, make_engine, monkeypatch):
+        pytest.importorskip("numpy")
+        pytest.importorskip("pyarrow")
+        eng = make_engine()
+        mount_id = eng.mount(str(shard), None)["mount_id"]
+        out = eng.index()
+        assert out["indexed"] == 2
+        assert out["index_size"] == eng.index_size() == 2
+
+        vec_file = eng._vector_file(_MERKLE_ROOT)
+        assert vec_file.name == f"{_MERKLE_ROOT}__text_embedding_3_small_384.npy"
+        assert vec_file.exists()
+        ids = json.loads(vec_file.with_suffix(".ids.json").read_text(encoding="utf-8"))
+        assert sorted(ids) == ["c1", "c2"]
+        eng.close()
+
+        rebooted = make_engine()
+        assert rebooted.boot()["success"] == 1
+        assert rebooted.index_size() == 2
+
+        # Re-indexing reads the saved matrix instead of re-embedding.
+        def no_embedding(*args, **kwargs):
+            raise AssertionError("claims were re-embedded")
+
+        monkeypatch.setattr(rebooted._index, "index_arrow", no_embedding)
+        assert rebooted.index()["index_size"] == 2
+
+        removed = []
+        remove_owner = rebooted._index.remove_owner
+        monkeypatch.setattr(rebooted._index, "remove_owner", lambda owner: removed.append(owner) or remove_owner(owner))
+        rebooted.unmount(mount_id)
+        assert removed == [mount_id]
+        assert rebooted.index_size() == 0
+
+    def test_index_without_pyarrow(self, shard, make_engine, monkeypatch):
+        monkeypatch.setattr(engine_module, "pyarrow", None)
+        eng = make_engine()
+        eng.mount(str(shard), None)
+        assert eng.index()["indexed"] == 2
+        assert eng.index_size() == 2
@@ -0,0 +1,385 @@
+"""
+Tests for Spectra runtime plumbing (axiom_runtime).
+
+Covers the audit flusher, the system vault, RWLock, DecisionLogger.iter_tail
+and the fast paths in transport._b64d_nonce and util.sanitize_identifier,
+each checked against the behaviour it replaced.
+
+Run:  python -m pytest tests/test_spectra_runtime.py -v
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import gc
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "spectra"))
+
+from axiom_runtime.audit import AuditLogger
+from axiom_runtime.decision_loop import DecisionLogger
+from axiom_runtime.util import RWLock, sanitize_identifier
+
+
+def _read_jsonl(path: Path) -> list:
+    return [json.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+
+# ============================================================================
+# AuditLogger
+# ============================================================================
+
+class TestAuditLogger:
+
+    def test_flush_close_round_trip(self, tmp_path):
+        path = tmp_path / "audit" / "audit.jsonl"
+        log = AuditLogger(str(path), flush_interval=60)
+        log.write_event({"event": "a", "n": 1})
+        log.write_event({"event": "b", "ts": 5.0})
+        log.flush()
+        rows = _read_jsonl(path)
+        assert [r["event"] for r in rows] == ["a", "b"]
+        assert isinstance(rows[0]["ts"], float)
+        assert rows[1]["ts"] == 5.0
+
+        log.write_event({"event": "c"})
+        log.close()
+        assert [r["event"] for r in _read_jsonl(path)] == ["a", "b", "c"]
+
+    def test_line_format_unchanged(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = AuditLogger(str(path))
+        event = {"ts": 1.5, "event": "mount", "path": "dé/x", "n": [1, None]}
+        log.write_event(event)
+        log.close()
+        assert path.read_bytes() == (json.dumps(event, sort_keys=True) + "\n").encode("ascii")
+
+    def test_write_after_close_raises(self, tmp_path):
+        log = AuditLogger(str(tmp_path / "audit.jsonl"))
+        log.close()
+        log.close()
+        with pytest.raises(ValueError):
+            log.write_event({"event": "late"})
+
+    def test_bad_event_raises_in_caller(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = AuditLogger(str(path), flush_interval=60)
+        log.write_event({"event": "ok"})
+        with pytest.raises(TypeError):
+            log.write_event({"event": "bad", "value": object()})
+        log.write_event({"event": "after"})
+        log.flush()
+        assert log._thread.is_alive()
+        log.close()
+        assert [r["event"] for r in _read_jsonl(path)] == ["ok", "after"]
+
+    def test_buffer_threshold_wakes_flusher(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = AuditLogger(str(path), buffer_events=4, flush_interval=60)
+        for i in range(4):
+            log.write_event({"event": "e", "i": i})
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and len(_read_jsonl(path)) < 4:
+            time.sleep(0.01)
+        assert [r["i"] for r in _read_jsonl(path)] == [0, 1, 2, 3]
+        log.close()
+
+    def test_unreferenced_logger_is_finalized(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        log = AuditLogger(str(path), flush_interval=60)
+        log.write_event({"event": "dropped"})
+        thread = log._thread
+        del log
+        gc.collect()
+        assert not thread.is_alive()
+        assert [r["event"] for r in _read_jsonl(path)] == ["dropped"]
+
+
+# ============================================================================
+# SystemVault
+# ============================================================================
+
+@pytest.fixture
+def vault_conn(tmp_path, monkeypatch):
+    pytest.importorskip("cryptography")
+    from axiom_runtime.db import SCHEMA_V1, SystemVault
+    monkeypatch.setenv("SPECTRA_SYSTEM_KEY", "test-system-key")
+    conn = sqlite3.connect(str(tmp_path / "catalog.db"))
+    conn.executescript(SCHEMA_V1)
+    yield SystemVault(conn), conn
+    conn.close()
+
+
+class TestSystemVault:
+
+    def test_encrypt_decrypt(self, vault_conn):
+        vault, _conn = vault_conn
+        token = vault.encrypt("s3cret é")
+        assert token[:1] == b"\x01"
+        assert vault.decrypt(token) == "s3cret é"
+        # Fresh nonce per token.
+        assert vault.encrypt("s3cret é") != token
+
+    def test_tampered_token_rejected(self, vault_conn):
+        vault, _conn = vault_conn
+        token = bytearray(vault.encrypt("s3cret"))
+        token[-1] ^= 1
+        with pytest.raises(Exception):
+            vault.decrypt(bytes(token))
+
+    def test_legacy_fernet_token(self, vault_conn):
+        vault, conn = vault_conn
+        from cryptography.fernet import Fernet
+        # Secrets written before the AES-GCM switch: Fernet over PBKDF2(key, salt).
+        salt_b64 = conn.execute("SELECT value FROM meta WHERE key='vault_salt'").fetchone()[0]
+        derived = hashlib.pbkdf2_hmac(
+            "sha256", b"test-system-key", base64.b64decode(salt_b64), 600000, dklen=32
+        )
+        legacy = Fernet(base64.urlsafe_b64encode(derived)).encrypt(b"old secret")
+        assert vault.decrypt(legacy) == "old secret"
+
+
+# ============================================================================
+# RWLock
+# ============================================================================
+
+class TestRWLock:
+
+    def test_reentrancy(self):
+        lock = RWLock()
+        with lock.read():
+            with lock.read():
+                pass
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    pass
+        # Fully released: another thread can take the write lock.
+        done = threading.Event()
+
+        def writer():
+            with lock.write():
+                done.set()
+
+        t = threading.Thread(target=writer)
+        t.start()
+        t.join(5)
+        assert done.is_set()
+
+    def test_upgrade_rejected(self):
+        lock = RWLock()
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                with lock.write():
+                    pass
+        # The failed upgrade leaves the lock usable.
+        with lock.write():
+            pass
+
+    def test_writer_waits_for_readers(self):
+        lock = RWLock()
+        order = []
+        acquired = threading.Event()
+
+        def writer():
+            with lock.write():
+                order.append("write")
+                acquired.set()
+
+        with lock.read():
+            t = threading.Thread(target=writer)
+            t.start()
+            assert not acquired.wait(0.1)
+            order.append("read-exit")
+        t.join(5)
+        assert order == ["read-exit", "write"]
+
+    def test_release_on_exception(self):
+        lock = RWLock()
+        with pytest.raises(KeyError):
+            with lock.write():
+                raise KeyError("x")
+        with pytest.raises(KeyError):
+            with lock.read():
+                raise KeyError("y")
+        assert lock._writer == 0 and lock._readers == 0
+
+
+# ============================================================================
+# DecisionLogger.iter_tail
+# ============================================================================
+
+@pytest.fixture
+def decision_log(tmp_path) -> DecisionLogger:
+    logger = DecisionLogger(tmp_path / "interactions.jsonl")
+    rng = random.Random(7)
+    for i in range(60):
+        # Lines of 1-9 KiB so tails cross several 64 KiB blocks.
+        logger.record(f"q{i} " + "x" * rng.randint(1000, 9000), f"a{i}", [])
+    return logger
+
+
+class TestIterTail:
+
+    def test_tail_crosses_block_boundary(self, decision_log):
+        logger = decision_log
+        assert logger.log_path.stat().st_size > 3 * 64 * 1024
+        everything = logger.load()
+        for n in (1, 7, 8, 9, 25, 59, 60, 500):
+            assert list(logger.iter_tail(n)) == everything[-n:]
+
+    def test_tail_all(self, decision_log):
+        logger = decision_log
+        assert list(logger.iter_tail()) == logger.load()
+        assert logger.count() == 60
+
+    def test_missing_log(self, tmp_path):
+        logger = DecisionLogger(tmp_path / "absent.jsonl")
+        assert list(logger.iter_tail(5)) == []
+
+
+# ============================================================================
+# Fast-path equivalence
+# ============================================================================
+
+def _random_nonce_strings(rng: random.Random) -> list:
+    alphabet = "ABCXYZabcxyz0189+/"
+    odd = ["=", "==", " ", "\n", "!", "-", "_", "é", "\x00", ".", ":"]
+    out = ["", "A" * 16, "A" * 15, "A" * 17, "AAAAAAAAAAAAAA==", "AAAAAAAAAAAAAAA="]
+    for _ in range(3000):
+        s = list(base64.b64encode(rng.randbytes(12)).decode("ascii"))
+        for _ in range(rng.randint(0, 2)):
+            pos = rng.randrange(len(s))
+            if rng.random() < 0.5:
+                s[pos] = rng.choice(odd)
+            else:
+                s.insert(pos, rng.choice(odd + list(alphabet)))
+        out.append("".join(s))
+    return out
+
+
+class TestFastPaths:
+
+    def test_b64d_nonce_matches_strict_decode(self):
+        pytest.importorskip("cryptography")
+        from axiom_runtime.transport import ClarionError, TransportAdapter
+
+        def reference(s):
+            try:
+                return base64.b64decode(s, validate=True)
+            except (binascii.Error, ValueError):
+                return ClarionError
+
+        for s in _random_nonce_strings(random.Random(11)):
+            expected = reference(s)
+            try:
+                got = TransportAdapter._b64d_nonce(s, field="nonce")
+            except ClarionError:
+                got = ClarionError
+            assert got == expected, repr(s)
+
+    def test_sanitize_identifier_matches_regex(self):
+        pattern = re.compile(r"[^a-zA-Z0-9_]+")
+
+        def reference(s):
+            s = pattern.sub("_", str(s).strip()).strip("_")
+            return s[:64] if s else "x"
+
+        rng = random.Random(5)
+        chars = "aZ09_-. /\té中$"
+        samples = ["", "_", "__a__", "-a-", "a--b", "a_-_b", " x ", "été", "a" * 80, 42]
+        samples += ["".join(rng.choice(chars) for _ in range(rng.randint(0, 70))) for _ in range(3000)]
+        for s in samples:
+            assert sanitize_identifier(s) == reference(s), repr(s)
+
+
+# ============================================================================
+# Clarion AAD
+# ============================================================================
+
+_ENVELOPE_PATHS = ["manifest.json", "graph/claims.parquet", 'odd/"quoted"\\name.txt', "dé/中文/ß.bin", "tab\there"]
+
+
+def _reference_aad(envelope_id, shard_id, rel_path, key, value) -> bytes:
+    return json.dumps(
+        {"envelope_id": envelope_id, "shard_id": shard_id, "path": rel_path, key: value},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _write_envelope(root: Path, version: str, secret: bytes) -> Path:
+    """v1.x envelope over _ENVELOPE_PATHS; v1.1 entries carry plaintext_hash."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    env = root / f"envelope_v{version}"
+    (env / "blobs").mkdir(parents=True)
+    salt = bytes(range(16))
+    aesgcm = AESGCM(HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=b"clarion").derive(secret))
+    files = []
+    for i, rel_path in enumerate(_ENVELOPE_PATHS):
+        plaintext = f"file {i}: {rel_path}".encode("utf-8")
+        nonce = bytes([i]) * 12
+        entry = {"path": rel_path, "nonce_b64": base64.b64encode(nonce).decode("ascii")}
+        if version == "1.1":
+            entry["plaintext_hash"] = hashlib.sha256(plaintext).hexdigest()
+            aad = _reference_aad("env-é", "shard-1", rel_path, "plaintext_hash", entry["plaintext_hash"])
+            blob = aesgcm.encrypt(nonce, plaintext, aad)
+        else:
+            # v1.0 binds the ciphertext hash into its own AAD, so no valid
+            # ciphertext exists; the AAD is still fully determined.
+            blob = plaintext
+        entry["blob_hash"] = hashlib.sha256(blob).hexdigest()
+        (env / "blobs" / entry["blob_hash"]).write_bytes(blob)
+        files.append(entry)
+    (env / "envelope.json").write_text(json.dumps({
+        "clarion_version": version,
+        "encryption_algo": "AES-256-GCM",
+        "envelope_id": "env-é",
+        "shard_id": "shard-1",
+        "kdf": {"name": "HKDF-SHA256", "salt_b64": base64.b64encode(salt).decode("ascii"), "info": "clarion"},
+        "files": files,
+    }), encoding="utf-8")
+    return env
+
+
+class TestClarionAad:
+
+    @pytest.mark.parametrize("version", ["1.0", "1.1"])
+    def test_entry_aad_matches_reference(self, tmp_path, version):
+        pytest.importorskip("cryptography")
+        from axiom_runtime.transport import TransportAdapter
+
+        secret = b"k" * 32
+        env = _write_envelope(tmp_path, version, secret)
+        _env_path, envelope = TransportAdapter._load_envelope(str(env))
+        _aesgcm, entries, _blobs, aad_parts = TransportAdapter._prepare_v1(
+            env, envelope, base64.b64encode(secret).decode("ascii")
+        )
+        assert [e.path for e in entries] == _ENVELOPE_PATHS
+        for entry in entries:
+            key = "plaintext_hash" if version == "1.1" else "blob_hash"
+            expected = _reference_aad("env-é", "shard-1", entry.path, key, getattr(entry, key))
+            assert TransportAdapter._entry_aad(entry, aad_parts) == expected, entry.path
+
+    def test_v11_round_trip(self, tmp_path):
+        pytest.importorskip("cryptography")
+        from axiom_runtime.transport import TransportAdapter
+
+        secret = b"k" * 32
+        env = _write_envelope(tmp_path, "1.1", secret)
+        out = TransportAdapter.decrypt_envelope_to_memory(str(env), base64.b64encode(secret).decode("ascii"))
+        assert out == {p: f"file {i}: {p}".encode("utf-8") for i, p in enumerate(_ENVELOPE_PATHS)}
@@ -9,11 +9,17 @@ Run:  python -m pytest tests/test_tier3_pipeline.py -v
 """
 from __future__ import annotations
 
+import itertools
 import json
 import sys
 import tempfile
 from pathlib import Path
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "forge"))
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -28,23 +34,28 @@ from scripts.doctor_tier3 import validate_candidates_against_source, run_tier3_d
 # ============================================================================
 
 def _write(path: Path, text: str) -> None:
-    path.write_text(text, encoding="utf-8")
+    path.write_bytes(text.encode("utf-8"))
 
 
 def _write_jsonl(path: Path, records: list) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        for r in records:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    # One buffer, one write.
+    if orjson is not None:
+        path.write_bytes(b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in records))
+        return
+    path.write_bytes("".join(
+        json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records
+    ).encode("utf-8"))
 
 
 def _read_jsonl(path: Path) -> list:
-    out = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if s:
-                out.append(json.loads(s))
-    return out
+    loads = orjson.loads if orjson is not None else json.loads
+    return [loads(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+
+def _byte_spans(chunks: list) -> tuple:
+    """(starts, ends) offsets of the byte strings `chunks` laid end to end."""
+    ends = list(itertools.accumulate(map(len, chunks)))
+    return [0] + ends[:-1], ends
 
 
 # ============================================================================
@@ -119,15 +130,14 @@ class TestSegmenter:
         source = text.encode("utf-8")
         segs = segment_source(source)
 
-        covered = set()
+        covered = bytearray(len(source))
         for s in segs:
-            for i in range(s.byte_start, s.byte_end):
-                covered.add(i)
+            covered[s.byte_start:s.byte_end] = b"\x01" * (s.byte_end - s.byte_start)
 
         # Every non-whitespace byte should be covered
         for i, b in enumerate(source):
             if chr(b).strip():
-                assert i in covered, f"Byte {i} ({chr(b)!r}) not covered by any segment"
+                assert covered[i], f"Byte {i} ({chr(b)!r}) not covered by any segment"
 
     def test_empty_input(self):
         segs = segment_source(b"")
@@ -237,13 +247,10 @@ class TestBinder:
 
     def test_basic_binding(self):
         text = "Aspirin reduces inflammation. It also prevents blood clots."
-        source = text.encode("utf-8")
 
         s0_text = "Aspirin reduces inflammation. "
         s1_text = "It also prevents blood clots."
-        s0_end = len(s0_text.encode("utf-8"))
-        s1_start = s0_end
-        s1_end = s1_start + len(s1_text.encode("utf-8"))
+        (_, s1_start), (s0_end, s1_end) = _byte_spans([t.encode("utf-8") for t in (s0_text, s1_text)])
 
         with tempfile.TemporaryDirectory() as tmp:
             src, sent, raw, out = self._setup(tmp, text,
@@ -275,7 +282,7 @@ class TestBinder:
         # Manually compute spans
         s0 = "The engine overheated. "
         s1 = "This caused gasket failure."
-        s0_end = len(s0.encode("utf-8"))
+        _, (s0_end, _) = _byte_spans([t.encode("utf-8") for t in (s0, s1)])
 
         with tempfile.TemporaryDirectory() as tmp:
             src, sent, raw, out = self._setup(tmp, text,
@@ -302,14 +309,11 @@ class TestBinder:
     def test_noncontiguous_split(self):
         """Non-contiguous IDs [0, 2] should produce two separate candidates."""
         text = "Fact A. Unrelated. Fact B."
-        source = text.encode("utf-8")
 
         s0 = "Fact A. "
         s1 = "Unrelated. "
         s2 = "Fact B."
-        b0 = len(s0.encode("utf-8"))
-        b1 = b0 + len(s1.encode("utf-8"))
-        b2 = b1 + len(s2.encode("utf-8"))
+        _, (b0, b1, b2) = _byte_spans([t.encode("utf-8") for t in (s0, s1, s2)])
 
         with tempfile.TemporaryDirectory() as tmp:
             src, sent, raw, out = self._setup(tmp, text,
@@ -432,9 +436,9 @@ class TestDoctor:
         with tempfile.TemporaryDirectory() as tmp:
             d = Path(tmp)
             text = "Tranexamic acid inhibits fibrinolysis.\n"
-            _write(d / "source.txt", text)
-
             source = text.encode("utf-8")
+            (d / "source.txt").write_bytes(source)
+
             ev = "Tranexamic acid inhibits fibrinolysis."
             ev_bytes = ev.encode("utf-8")
             bs = source.find(ev_bytes)
@@ -491,9 +495,9 @@ class TestDoctor:
         with tempfile.TemporaryDirectory() as tmp:
             d = Path(tmp)
             text = "The drug works. Studies confirm the drug works in practice."
-            _write(d / "source.txt", text)
-
             source = text.encode("utf-8")
+            (d / "source.txt").write_bytes(source)
+
             ev = "drug works"
             ev_bytes = ev.encode("utf-8")
             bs = source.find(ev_bytes)
@@ -507,6 +511,43 @@ class TestDoctor:
             assert r.ok
             assert r.ambiguous_spans == 1
             assert r.ambiguity_rate == 1.0
+            assert r.ambiguity_method == "per_needle"
+
+    def test_long_evidence_skips_ambiguity_scan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            d = Path(tmp)
+            ev = "The drug works in practice. " * 10
+            _write(d / "source.txt", "Preamble. " + ev)
+
+            ev_bytes = ev.encode("utf-8")
+            bs = len(b"Preamble. ")
+            _write_jsonl(d / "candidates.jsonl", [{
+                "subject": "drug", "predicate": "works", "object": "yes",
+                "evidence": ev, "byte_start": bs, "byte_end": bs + len(ev_bytes),
+            }])
+
+            r = validate_candidates_against_source(d / "source.txt", d / "candidates.jsonl")
+            assert r.ok
+            assert r.ambiguous_spans == 0
+            assert r.ambiguity_method == "length_skip"
+
+    def test_long_evidence_scanned_in_large_source(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            d = Path(tmp)
+            ev = "The drug works in practice. " * 10
+            filler = "x" * (1 << 20)
+            _write(d / "source.txt", ev + filler + ev)
+
+            ev_bytes = ev.encode("utf-8")
+            _write_jsonl(d / "candidates.jsonl", [{
+                "subject": "drug", "predicate": "works", "object": "yes",
+                "evidence": ev, "byte_start": 0, "byte_end": len(ev_bytes),
+            }])
+
+            r = validate_candidates_against_source(d / "source.txt", d / "candidates.jsonl")
+            assert r.ok
+            assert r.ambiguous_spans == 1
+            assert r.ambiguity_method == "per_needle"
 
 
 # ============================================================================
@@ -531,7 +572,8 @@ class TestEndToEnd:
             raw_path = d / "raw_claims.jsonl"
             cand_path = d / "candidates.jsonl"
 
-            _write(src_path, source_text)
+            source_bytes = source_text.encode("utf-8")
+            src_path.write_bytes(source_bytes)
 
             # Stage 0: Segment
             n = run_segmentation(src_path, sent_path)
@@ -539,10 +581,10 @@ class TestEndToEnd:
 
             # Verify segmenter output
             sents = _read_jsonl(sent_path)
-            source_bytes = source_text.encode("utf-8")
+            source_view = memoryview(source_bytes)
             for s in sents:
-                actual = source_bytes[s["byte_start"]:s["byte_end"]].decode("utf-8")
-                assert actual == s["text"], f"Segment {s['index']} byte mismatch"
+                actual = source_view[s["byte_start"]:s["byte_end"]]
+                assert actual == s["text"].encode("utf-8"), f"Segment {s['index']} byte mismatch"
 
             # Stage 1: Simulate LLM output (synthetic raw_claims)
             raw_claims = [
@@ -598,7 +640,7 @@ class TestEndToEnd:
                 assert isinstance(c["byte_end"], int)
                 # Byte-exact: evidence matches source slice
                 ev = c["evidence"].encode("utf-8")
-                actual = source_bytes[c["byte_start"]:c["byte_end"]]
+                actual = source_view[c["byte_start"]:c["byte_end"]]
                 assert ev == actual
 
     def test_pipeline_with_unicode(self):
@@ -641,27 +683,33 @@ class TestEndToEnd:
 # Runner
 # ============================================================================
 
+_TEST_CLASSES = (TestSegmenter, TestStage1Helpers, TestBinder, TestDoctor, TestEndToEnd)
+
+# (class, method name) for every test, in report order; built once at import.
+_TEST_TASKS = tuple(
+    (cls, method_name)
+    for cls in _TEST_CLASSES
+    for method_name in sorted(m for m in vars(cls) if m.startswith("test_"))
+)
+
+
 def _run_all():
     """Simple test runner (no pytest dependency)."""
     import traceback
-    classes = [TestSegmenter, TestStage1Helpers, TestBinder, TestDoctor, TestEndToEnd]
     passed = 0
     failed = 0
     errors = []
 
-    for cls in classes:
-        instance = cls()
-        methods = [m for m in dir(instance) if m.startswith("test_")]
-        for method_name in sorted(methods):
-            name = f"{cls.__name__}.{method_name}"
-            try:
-                getattr(instance, method_name)()
-                print(f"  PASS  {name}")
-                passed += 1
-            except Exception as exc:
-                print(f"  FAIL  {name}: {exc}")
-                errors.append((name, traceback.format_exc()))
-                failed += 1
+    for cls, method_name in _TEST_TASKS:
+        name = f"{cls.__name__}.{method_name}"
+        try:
+            getattr(cls(), method_name)()
+            print(f"  PASS  {name}")
+            passed += 1
+        except Exception as exc:
+            print(f"  FAIL  {name}: {exc}")
+            errors.append((name, traceback.format_exc()))
+            failed += 1
 
     print(f"\n{'='*60}")
     print(f"Results: {passed} passed, {failed} failed")
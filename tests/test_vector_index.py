@@ -0,0 +1,172 @@
+"""
+Tests for Spectra's VectorIndex (axiom_runtime.retrieval).
+
+The shipped Embedder is a stub that returns zero vectors, so these tests
+use a deterministic fake embedder with known geometry.
+
+Run:  python -m pytest tests/test_vector_index.py -v
+"""
+from __future__ import annotations
+
+import hashlib
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "spectra"))
+
+from axiom_runtime import retrieval
+from axiom_runtime.retrieval import Embedder, VectorIndex
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+class FakeEmbedder(Embedder):
+    """Bag-of-words embedder: each word adds 1.0 to a hash-chosen dimension."""
+
+    def __init__(self, dim: int = 64) -> None:
+        super().__init__(model="fake", dim=dim)
+
+    def embed(self, text: str) -> List[float]:
+        vec = [0.0] * self.dimension
+        for word in text.lower().split():
+            slot = int.from_bytes(hashlib.blake2b(word.encode(), digest_size=4).digest(), "big")
+            vec[slot % self.dimension] += 1.0
+        return vec
+
+    def embed_batch(self, texts: List[str]) -> Any:
+        return [self.embed(t) for t in texts]
+
+
+_CLAIMS = [
+    {"claim_id": "c_drug", "evidence": "tranexamic acid reduces bleeding"},
+    {"claim_id": "c_trial", "evidence": "the crash trial enrolled trauma patients"},
+    {"claim_id": "c_spo", "subject": "lysine", "predicate": "binds", "object": "plasminogen"},
+    {"claim_id": "", "evidence": "rows without a claim id are skipped"},
+]
+
+
+def _index(quantize: bool = False) -> VectorIndex:
+    idx = VectorIndex(FakeEmbedder(), quantize=quantize)
+    idx.index_claims(_CLAIMS, owner="m1")
+    return idx
+
+
+# ============================================================================
+# Search
+# ============================================================================
+
+class TestSearch:
+
+    def test_index_claims_skips_missing_ids(self):
+        idx = VectorIndex(FakeEmbedder())
+        assert idx.index_claims(_CLAIMS) == 3
+        assert idx.size == 3
+
+    def test_best_match_first(self):
+        idx = _index()
+        hits = idx.search("tranexamic acid reduces bleeding", top_k=2)
+        assert [cid for cid, _ in hits][0] == "c_drug"
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert hits[0][1] >= hits[1][1]
+
+    def test_spo_text_used_without_evidence(self):
+        hits = _index().search("lysine binds plasminogen", top_k=1)
+        assert hits[0][0] == "c_spo"
+
+    def test_top_k_bounds(self):
+        idx = _index()
+        assert len(idx.search("trial", top_k=10)) == 3
+        assert idx.search("trial", top_k=0) == []
+
+    def test_zero_query_returns_nothing(self):
+        idx = _index()
+        assert idx.search("", top_k=3) == []
+
+    def test_stub_embedder_returns_nothing(self):
+        idx = VectorIndex(Embedder(dim=8))
+        idx.add("c1", "anything")
+        assert idx.size == 1
+        assert idx.search("anything") == []
+
+    def test_list_fallback_matches_numpy(self, monkeypatch):
+        pytest.importorskip("numpy")
+        expected = _index().search("crash trial patients", top_k=3)
+        monkeypatch.setattr(retrieval, "np", None)
+        got = _index().search("crash trial patients", top_k=3)
+        assert [c for c, _ in got] == [c for c, _ in expected]
+        for (_, a), (_, b) in zip(got, expected):
+            assert a == pytest.approx(b, abs=1e-5)
+
+    def test_quantized_ranking_matches(self):
+        pytest.importorskip("numpy")
+        exact = _index().search("tranexamic bleeding trial", top_k=3)
+        quant = _index(quantize=True).search("tranexamic bleeding trial", top_k=3)
+        assert [c for c, _ in quant] == [c for c, _ in exact]
+        for (_, a), (_, b) in zip(quant, exact):
+            assert a == pytest.approx(b, abs=0.02)
+
+    def test_growth_past_initial_capacity(self, monkeypatch):
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(VectorIndex, "_INITIAL_CAPACITY", 2)
+        idx = _index()
+        idx.index_claims([{"claim_id": f"x{i}", "evidence": f"word{i}"} for i in range(5)])
+        assert idx.size == 8
+        assert idx.search("tranexamic acid", top_k=1)[0][0] == "c_drug"
+
+
+# ============================================================================
+# Owners: tombstones, compaction, persistence
+# ============================================================================
+
+class TestOwners:
+
+    def test_remove_owner_hides_rows(self):
+        idx = _index()
+        idx.index_claims([{"claim_id": "c_other", "evidence": "tranexamic acid dosing"}], owner="m2")
+        assert idx.remove_owner("m1") == 3
+        assert idx.size == 1
+        assert [c for c, _ in idx.search("tranexamic acid", top_k=5)] == ["c_other"]
+
+    def test_tombstones_below_threshold_are_masked(self):
+        idx = VectorIndex(FakeEmbedder())
+        idx.index_claims([{"claim_id": f"k{i}", "evidence": f"keep{i} shared"} for i in range(4)], owner="keep")
+        idx.index_claims([{"claim_id": "gone", "evidence": "shared"}], owner="drop")
+        assert idx.remove_owner("drop") == 1
+        # 1 dead of 5 rows stays under the compaction threshold.
+        assert idx._dead == 1
+        assert "gone" not in [c for c, _ in idx.search("shared", top_k=5)]
+
+    def test_compaction_keeps_live_rows(self):
+        idx = _index()
+        idx.index_claims([{"claim_id": "c_other", "evidence": "bleeding risk"}], owner="m2")
+        idx.remove_owner("m1")
+        assert idx._dead == 0
+        assert idx.search("bleeding risk", top_k=1)[0][0] == "c_other"
+        assert idx.remove_owner("m1") == 0
+
+    def test_save_load_round_trip(self, tmp_path):
+        pytest.importorskip("numpy")
+        path = tmp_path / "vectors" / "m1.npy"
+        idx = _index(quantize=True)
+        assert idx.save_owner("m1", path)
+
+        fresh = VectorIndex(FakeEmbedder())
+        assert fresh.load_owner("m1", path) == 3
+        expected = _index().search("crash trial", top_k=3)
+        got = fresh.search("crash trial", top_k=3)
+        assert [c for c, _ in got] == [c for c, _ in expected]
+
+    def test_load_rejects_dimension_mismatch(self, tmp_path):
+        pytest.importorskip("numpy")
+        path = tmp_path / "m1.npy"
+        assert _index().save_owner("m1", path)
+        assert VectorIndex(FakeEmbedder(dim=32)).load_owner("m1", path) is None
+
+    def test_load_missing_file(self, tmp_path):
+        path = tmp_path / "absent.npy"
+        assert VectorIndex(FakeEmbedder()).load_owner("m1", path) is None